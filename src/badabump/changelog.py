@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import bisect
+import collections
 import dataclasses
+import io
+import itertools
 import logging
+import os
 import re
-from typing import TYPE_CHECKING, Union
+from functools import lru_cache
+from logging.handlers import BufferingHandler
+from typing import IO, TYPE_CHECKING, Union
 
 from badabump.datetimes import utcnow_naive
 from badabump.enums import ChangeLogTypeEnum, FormatTypeEnum
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    import datetime
+    from collections.abc import Callable, Iterable, Iterator
 
     from typing_extensions import Self
 
@@ -23,21 +31,44 @@ COMMIT_TYPE_FIX = "fix"
 COMMIT_TYPE_REFACTOR = "refactor"
 COMMIT_TYPE_UNKNOWN = "unknown"
 
-COMMIT_TYPE_SUBJECT_RE = re.compile(
-    r"^(?P<commit_type>[^\:]+)\: (?P<description>.+)$"
+# Conventional commit grammar: type, optional scope & breaking change mark.
+# Raw commit type is never empty, but its clean commit type might be (e.g. for
+# raw commit type "!")
+COMMIT_TYPE_PATTERN = (
+    r"(?P<raw_commit_type>(?=[^\:])(?P<clean_commit_type>"
+    r"(?P<commit_type>[^\:\(]+)\((?P<scope>[^\)\:]+)\)|[^\:]*?)"
+    r"(?P<breaking>\!)?)"
 )
-COMMIT_TYPE_SCOPE_RE = re.compile(
-    r"^(?P<commit_type>[^\(]+)\((?P<scope>[^\)]+)\)$"
+COMMIT_SUBJECT_RE = re.compile(
+    rf"^{COMMIT_TYPE_PATTERN}\: (?P<description>.+)$"
 )
+COMMIT_TYPE_RE = re.compile(rf"^{COMMIT_TYPE_PATTERN}$")
 
 ISSUE_RE = re.compile(
     r"^(Closes|Fixes|Issue|Ref|Relates): (?P<issue>.+)$", re.M
 )
 
+FORMATTED_COMMIT_PR_NUMBERS_RE = re.compile(
+    r" \((?P<pr_numbers>\#\d+(?:, \#\d+)*)\)$"
+)
 FORMATTED_COMMIT_WITH_PR_RE = re.compile(
     r"^(?P<formatted_commit>.*) \(\#(?P<pr_number>\d+)\)$"
 )
 
+# Changelog sections in order of appearance. Commits of any other types go to
+# the last one
+SECTION_LABELS = ("Features:", "Fixes:", "Refactoring:", "Other:")
+SECTION_INDEXES = {
+    COMMIT_TYPE_FEATURE: 0,
+    COMMIT_TYPE_FIX: 1,
+    COMMIT_TYPE_REFACTOR: 2,
+}
+OTHER_SECTION_INDEX = 3
+
+# Parse commits in process pool only if there are that many of them
+PARSE_PARALLEL_THRESHOLD = 100_000
+PARSE_CHUNK_SIZE = 25_000
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,22 +79,48 @@ class ConventionalCommit:
 
     body: Union[str, None] = None
 
-    @property
-    def clean_commit_type(self) -> str:
-        commit_type = self.raw_commit_type
-        if commit_type[-1] == BREAKING_CHANGE_IN_COMMIT_TYPE:
-            return commit_type[:-1]
-        return commit_type
+    commit_type: str = dataclasses.field(init=False, repr=False, compare=False)
+    clean_commit_type: str = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    scope: Union[str, None] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    is_breaking_change: bool = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    issues: tuple[str, ...] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        commit_type, clean_commit_type, scope, is_breaking_change = (
+            parse_commit_type(self.raw_commit_type)
+        )
 
-    @property
-    def commit_type(self) -> str:
-        commit_type = self.clean_commit_type
+        body = self.body
+        issues: tuple[str, ...] = ()
+        if body is not None:
+            is_breaking_change = (
+                is_breaking_change or BREAKING_CHANGE_IN_BODY in body
+            )
+            issues = tuple(item.strip() for _, item in ISSUE_RE.findall(body))
 
-        maybe_matched = COMMIT_TYPE_SCOPE_RE.match(commit_type)
-        if maybe_matched is not None:
-            return maybe_matched.groupdict()["commit_type"]
+        object.__setattr__(self, "commit_type", commit_type)
+        object.__setattr__(self, "clean_commit_type", clean_commit_type)
+        object.__setattr__(self, "scope", scope)
+        object.__setattr__(self, "is_breaking_change", is_breaking_change)
+        object.__setattr__(self, "issues", issues)
 
-        return commit_type
+    def __reduce__(
+        self,
+    ) -> tuple[Callable[..., ConventionalCommit], tuple[object, ...]]:
+        # Parsed commits are sent back from process pool workers, so restore
+        # them as is, without parsing again
+        return (
+            restore_commit,
+            tuple(getattr(self, name) for name in COMMIT_FIELDS),
+        )
 
     def format(  # noqa: A003
         self, format_type: FormatTypeEnum, *, ignore_footer_urls: bool = True
@@ -88,12 +145,14 @@ class ConventionalCommit:
         subject, *body = git_commit.splitlines()
         body_str = "\n".join(body[1:]) if body else None
 
-        maybe_matched = COMMIT_TYPE_SUBJECT_RE.match(subject)
+        maybe_matched = COMMIT_SUBJECT_RE.match(subject)
         if maybe_matched is not None:
-            matched_dict = maybe_matched.groupdict()
+            raw_commit_type, description = maybe_matched.group(
+                "raw_commit_type", "description"
+            )
             return cls(
-                raw_commit_type=matched_dict["commit_type"],
-                description=matched_dict["description"].strip(),
+                raw_commit_type=raw_commit_type,
+                description=description.strip(),
                 body=body_str,
             )
 
@@ -113,27 +172,26 @@ class ConventionalCommit:
             body=body_str,
         )
 
-    @property
-    def is_breaking_change(self) -> bool:
-        return self.raw_commit_type[-1] == BREAKING_CHANGE_IN_COMMIT_TYPE or (
-            self.body is not None and BREAKING_CHANGE_IN_BODY in self.body
-        )
 
-    @property
-    def issues(self) -> tuple[str, ...]:
-        if self.body is None:
-            return ()
-        return tuple(item.strip() for _, item in ISSUE_RE.findall(self.body))
+COMMIT_FIELDS = tuple(
+    item.name for item in dataclasses.fields(ConventionalCommit)
+)
+COMMIT_FIELD_SETTERS = tuple(
+    getattr(ConventionalCommit, name).__set__ for name in COMMIT_FIELDS
+)
 
-    @property
-    def scope(self) -> Union[str, None]:
-        commit_type = self.clean_commit_type
 
-        maybe_matched = COMMIT_TYPE_SCOPE_RE.match(commit_type)
-        if maybe_matched is not None:
-            return maybe_matched.groupdict()["scope"]
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class ChangeLogSection:
+    label: str
+    breaking_commits: tuple[ConventionalCommit, ...]
+    regular_commits: tuple[ConventionalCommit, ...]
 
-        return None
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class PreparedChangeLogSection:
+    label: str
+    items: tuple[str, ...]
 
 
 @dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
@@ -151,26 +209,73 @@ class ChangeLog:
         init=False
     )
 
-    def __post_init__(self) -> None:
-        feature_commits: list[ConventionalCommit] = []
-        fix_commits: list[ConventionalCommit] = []
-        refactor_commits: list[ConventionalCommit] = []
-        other_commits: list[ConventionalCommit] = []
+    sections: tuple[ChangeLogSection, ...] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    has_breaking_change: bool = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    has_minor_change: bool = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    has_micro_change: bool = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
 
+    prepared: dict[bool, tuple[PreparedChangeLogSection, ...]] = (
+        dataclasses.field(
+            default_factory=dict, init=False, repr=False, compare=False
+        )
+    )
+
+    def __post_init__(self) -> None:
+        # Commits, breaking commits & regular commits by section index
+        all_commits: list[list[ConventionalCommit]] = []
+        breaking_commits: list[list[ConventionalCommit]] = []
+        regular_commits: list[list[ConventionalCommit]] = []
+        for _ in SECTION_LABELS:
+            all_commits.append([])
+            breaking_commits.append([])
+            regular_commits.append([])
+
+        has_breaking_change = False
         for commit in self.commits:
-            if commit.commit_type == COMMIT_TYPE_FEATURE:
-                feature_commits.append(commit)
-            elif commit.commit_type == COMMIT_TYPE_FIX:
-                fix_commits.append(commit)
-            elif commit.commit_type == COMMIT_TYPE_REFACTOR:
-                refactor_commits.append(commit)
+            idx = SECTION_INDEXES.get(commit.commit_type, OTHER_SECTION_INDEX)
+            all_commits[idx].append(commit)
+            if commit.is_breaking_change:
+                breaking_commits[idx].append(commit)
+                has_breaking_change = True
             else:
-                other_commits.append(commit)
+                regular_commits[idx].append(commit)
 
-        object.__setattr__(self, "feature_commits", tuple(feature_commits))
-        object.__setattr__(self, "fix_commits", tuple(fix_commits))
-        object.__setattr__(self, "refactor_commits", tuple(refactor_commits))
-        object.__setattr__(self, "other_commits", tuple(other_commits))
+        feature_commits, fix_commits, refactor_commits, other_commits = (
+            tuple(item) for item in all_commits
+        )
+        object.__setattr__(self, "feature_commits", feature_commits)
+        object.__setattr__(self, "fix_commits", fix_commits)
+        object.__setattr__(self, "refactor_commits", refactor_commits)
+        object.__setattr__(self, "other_commits", other_commits)
+
+        object.__setattr__(
+            self,
+            "sections",
+            tuple(
+                ChangeLogSection(
+                    label=label,
+                    breaking_commits=tuple(breaking_commits[idx]),
+                    regular_commits=tuple(regular_commits[idx]),
+                )
+                for idx, label in enumerate(SECTION_LABELS)
+                if all_commits[idx]
+            ),
+        )
+        object.__setattr__(self, "has_breaking_change", has_breaking_change)
+        object.__setattr__(self, "has_minor_change", len(feature_commits) > 0)
+        object.__setattr__(
+            self,
+            "has_micro_change",
+            len(feature_commits) != len(self.commits),
+        )
 
     def format(  # noqa: A003
         self,
@@ -180,17 +285,127 @@ class ChangeLog:
         is_pre_release: bool = False,
         ignore_footer_urls: bool = True,
     ) -> str:
+        stream = io.StringIO()
+        self.write(
+            stream,
+            changelog_type,
+            format_type,
+            is_pre_release=is_pre_release,
+            ignore_footer_urls=ignore_footer_urls,
+        )
+        return stream.getvalue()
+
+    def format_many(
+        self,
+        targets: Iterable[tuple[ChangeLogTypeEnum, FormatTypeEnum]],
+        *,
+        is_pre_release: bool = False,
+        ignore_footer_urls: bool = True,
+    ) -> tuple[str, ...]:
+        """Format changelog for each of given changelog & format types."""
+        return tuple(
+            self.format(
+                changelog_type,
+                format_type,
+                is_pre_release=is_pre_release,
+                ignore_footer_urls=ignore_footer_urls,
+            )
+            for changelog_type, format_type in targets
+        )
+
+    @classmethod
+    def from_chronological_git_commits(
+        cls,
+        git_commits: Iterable[str],
+        *,
+        strict: bool = True,
+        parallel: Union[bool, None] = None,
+    ) -> Self:
+        """Create changelog from commits, oldest first.
+
+        Commits are parsed one by one as they consumed, so passing output of
+        ``Git.iter_commits(..., reverse=True)`` does not require to keep all
+        commit messages in memory. See ``parse_many`` for ``parallel``
+        argument details.
+        """
+        return cls(
+            commits=parse_many(git_commits, strict=strict, parallel=parallel)
+        )
+
+    @classmethod
+    def from_git_commits(
+        cls,
+        git_commits: tuple[str, ...],
+        *,
+        strict: bool = True,
+        parallel: Union[bool, None] = None,
+    ) -> Self:
+        return cls.from_chronological_git_commits(
+            reversed(git_commits), strict=strict, parallel=parallel
+        )
+
+    def prepare(
+        self, format_type: FormatTypeEnum, *, ignore_footer_urls: bool = True
+    ) -> tuple[PreparedChangeLogSection, ...]:
+        """Format commits of each changelog section.
+
+        Result is kept within changelog, so rendering changelog several times
+        (e.g. for git commit & for changelog file) formats each commit once.
+        As formatted commits do not depend on format type, result is kept by
+        ``ignore_footer_urls`` flag only.
+        """
+        key = ignore_footer_urls
+        maybe_prepared = self.prepared.get(key)
+        if maybe_prepared is not None:
+            return maybe_prepared
+
+        prepared = self.prepared[key] = tuple(
+            PreparedChangeLogSection(
+                label=section.label,
+                items=tuple(
+                    itertools.chain.from_iterable(
+                        prepare_formatted_commits(
+                            iter(commits),
+                            format_type,
+                            ignore_footer_urls=ignore_footer_urls,
+                        )
+                        for commits in (
+                            section.breaking_commits,
+                            section.regular_commits,
+                        )
+                    )
+                ),
+            )
+            for section in self.sections
+        )
+        return prepared
+
+    def write(
+        self,
+        stream: IO[str],
+        changelog_type: ChangeLogTypeEnum,
+        format_type: FormatTypeEnum,
+        *,
+        is_pre_release: bool = False,
+        ignore_footer_urls: bool = True,
+    ) -> None:
+        """Write formatted changelog to the text stream.
+
+        Changelog is written section by section and item by item, instead of
+        joining all of them into one string first. Formatted commits
+        themselves are still kept within changelog (see :meth:`prepare`).
+        """
         if not self.commits:
-            return CHANGELOG_EMPTY
+            stream.write(CHANGELOG_EMPTY)
+            return
 
         is_git_commit = changelog_type == ChangeLogTypeEnum.git_commit
         is_rst = format_type == FormatTypeEnum.rst
 
-        def format_block(
-            label: str, commits: tuple[ConventionalCommit, ...]
-        ) -> Union[str, None]:
-            if not commits:
-                return None
+        for idx, section in enumerate(
+            self.prepare(format_type, ignore_footer_urls=ignore_footer_urls)
+        ):
+            label = section.label
 
             header: str
             if is_rst:
@@ -202,57 +417,9 @@ class ChangeLog:
             else:
                 header = markdown_h2(label)
 
-            breaking_items = format_commits(
-                item for item in commits if item.is_breaking_change
-            )
-            regular_items = format_commits(
-                item for item in commits if not item.is_breaking_change
-            )
-            items = "\n".join(
-                item for item in (breaking_items, regular_items) if item
-            )
-
-            return "\n\n".join((header, items))
-
-        def format_commits(commits: Iterator[ConventionalCommit]) -> str:
-            return "\n".join(
-                ul_li(item)
-                for item in prepare_formatted_commits(
-                    commits, format_type, ignore_footer_urls=ignore_footer_urls
-                )
-            )
-
-        features = format_block("Features:", self.feature_commits)
-        fixes = format_block("Fixes:", self.fix_commits)
-        refactor = format_block("Refactoring:", self.refactor_commits)
-        others = format_block("Other:", self.other_commits)
-
-        return "\n\n".join(
-            item for item in (features, fixes, refactor, others) if item
-        )
-
-    @classmethod
-    def from_git_commits(
-        cls, git_commits: tuple[str, ...], *, strict: bool = True
-    ) -> Self:
-        return cls(
-            commits=tuple(
-                ConventionalCommit.from_git_commit(item, strict=strict)
-                for item in reversed(git_commits)
-            )
-        )
-
-    @property
-    def has_breaking_change(self) -> bool:
-        return any(item for item in self.commits if item.is_breaking_change)
-
-    @property
-    def has_minor_change(self) -> bool:
-        return len(self.feature_commits) > 0
-
-    @property
-    def has_micro_change(self) -> bool:
-        return len(self.feature_commits) != len(self.commits)
+            stream.write(f"\n\n{header}\n" if idx else f"{header}\n")
+            for item in section.items:
+                stream.write(f"\n{ul_li(item)}")
 
 
 def bold(value: str) -> str:
@@ -288,13 +455,150 @@ def markdown_header(value: str, *, level: int) -> str:
     return f'{"#" * level} {value}'
 
 
+@lru_cache(maxsize=1024)
+def parse_commit_type(
+    raw_commit_type: str,
+) -> tuple[str, str, Union[str, None], bool]:
+    """Parse raw commit type into commit type, clean commit type, scope and
+    breaking change flag."""
+    maybe_matched = COMMIT_TYPE_RE.match(raw_commit_type)
+    if maybe_matched is None:
+        return (raw_commit_type, raw_commit_type, None, False)
+
+    commit_type, clean_commit_type, scope, breaking = maybe_matched.group(
+        "commit_type", "clean_commit_type", "scope", "breaking"
+    )
+    return (
+        commit_type or clean_commit_type,
+        clean_commit_type,
+        scope,
+        breaking is not None,
+    )
+
+
+def iter_chunks(items: Iterable[str], chunk_size: int) -> Iterator[list[str]]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+
+def parse_chunk(
+    git_commits: Iterable[str], *, strict: bool = True
+) -> tuple[ConventionalCommit, ...]:
+    from_git_commit = ConventionalCommit.from_git_commit
+    return tuple(from_git_commit(item, strict=strict) for item in git_commits)
+
+
+def parse_chunk_in_worker(
+    git_commits: list[str], *, strict: bool = True
+) -> tuple[tuple[ConventionalCommit, ...], list[logging.LogRecord]]:
+    """Parse chunk of git commits within process pool worker.
+
+    Instead of emitting warnings within worker, collect them to re-emit them
+    in the main process.
+    """
+    handler = BufferingHandler(capacity=len(git_commits) + 1)
+    logger.addHandler(handler)
+    propagate, logger.propagate = logger.propagate, False
+
+    try:
+        return (parse_chunk(git_commits, strict=strict), handler.buffer)
+    finally:
+        logger.propagate = propagate
+        logger.removeHandler(handler)
+
+
+def parse_many(
+    git_commits: Iterable[str],
+    *,
+    strict: bool = True,
+    parallel: Union[bool, None] = None,
+) -> tuple[ConventionalCommit, ...]:
+    """Parse multiple git commits as conventional commits, keeping order.
+
+    With ``parallel=True`` commits are parsed in large chunks within process
+    pool. By default, process pool is used only if there are at least
+    ``PARSE_PARALLEL_THRESHOLD`` commits and more than one CPU, so small
+    ranges do not pay its startup cost.
+    """
+    if parallel:
+        return parse_many_in_pool(git_commits, strict=strict)
+
+    if parallel is not None or (os.cpu_count() or 1) < 2:
+        return parse_chunk(git_commits, strict=strict)
+
+    # Parse commits in place, until it is clear there are enough of them to
+    # use process pool for the rest
+    iterator = iter(git_commits)
+    head = parse_chunk(
+        itertools.islice(iterator, PARSE_PARALLEL_THRESHOLD), strict=strict
+    )
+    if len(head) < PARSE_PARALLEL_THRESHOLD:
+        return head
+    return head + parse_many_in_pool(iterator, strict=strict)
+
+
+def parse_many_in_pool(
+    git_commits: Iterable[str], *, strict: bool = True
+) -> tuple[ConventionalCommit, ...]:
+    """Parse git commits in chunks within process pool, keeping order.
+
+    Only limited number of chunks is submitted to the pool at a time, so
+    commits are read from the iterable no faster than they are parsed.
+    """
+    # Importing process pool is costly, so do it only when it is needed
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = iter_chunks(git_commits, PARSE_CHUNK_SIZE)
+    max_pending = (os.cpu_count() or 1) * 2
+    parsed: list[ConventionalCommit] = []
+
+    with ProcessPoolExecutor() as executor:
+        pending = collections.deque(
+            executor.submit(parse_chunk_in_worker, chunk, strict=strict)
+            for chunk in itertools.islice(chunks, max_pending)
+        )
+
+        while pending:
+            commits, records = pending.popleft().result()
+            for record in records:
+                logger.handle(record)
+            parsed.extend(commits)
+
+            for chunk in itertools.islice(chunks, 1):
+                pending.append(
+                    executor.submit(
+                        parse_chunk_in_worker, chunk, strict=strict
+                    )
+                )
+
+    return tuple(parsed)
+
+
 def prepare_formatted_commits(
     commits: Iterator[ConventionalCommit],
     format_type: FormatTypeEnum,
     *,
     ignore_footer_urls: bool,
 ) -> list[str]:
-    storage = []
+    """Format commits, skipping duplicates & merging similar commits.
+
+    Commit with PR number is merged into the first formatted commit with PR
+    number(s), which starts with its text before PR number, unless that
+    commit already mentions same PR number. Such commit is found via binary
+    search over sorted formatted commits, so each lookup takes
+    ``O(log n + k)`` time, where ``k`` is number of formatted commits, which
+    start with same text.
+    """
+    storage: list[str] = []
+    # Formatted commits, which already have been added or merged, to skip
+    # duplicates
+    seen: set[str] = set()
+    # Formatted commits with PR number(s) & their indexes in the storage,
+    # sorted by text, to find ones starting with given prefix
+    index: list[tuple[str, int]] = []
+    # PR numbers of formatted commits in the storage by their indexes
+    pr_numbers: dict[int, set[str]] = {}
 
     for commit in commits:
         # First, format commit as asked
@@ -304,39 +608,67 @@ def prepare_formatted_commits(
 
         # Next, check whether it is already added to the storage. If previously
         # added - do nothing
-        if formatted_commit in storage:
+        if formatted_commit in seen:
             continue
+        seen.add(formatted_commit)
 
-        # If not yet added, check if commit match regex "with PR"
+        # If not yet added, check if commit match regex "with PR" and attempt
+        # to find first other commit with PR number(s) in storage, which
+        # starts with same text
         with_pr_matched = FORMATTED_COMMIT_WITH_PR_RE.match(formatted_commit)
-        # If not matched - just append formatted commit to the storage
-        if not with_pr_matched:
-            storage.append(formatted_commit)
-            continue
-
-        # Now, attempt to match other commit in storage
-        with_pr_data = with_pr_matched.groupdict()
-        with_pr_prefix = with_pr_data["formatted_commit"]
-        other_idx = -1
-
-        for idx, other_commit in enumerate(storage):
-            if other_commit.startswith(with_pr_prefix):
-                other_idx = idx
-                break
+        other_idx: Union[int, None] = None
+        pr_number = ""
+        if with_pr_matched:
+            with_pr_prefix = with_pr_matched["formatted_commit"]
+            pr_number = f"#{with_pr_matched['pr_number']}"
+            position = bisect.bisect_left(index, (with_pr_prefix,))
+            for other_commit, idx in itertools.islice(index, position, None):
+                if not other_commit.startswith(with_pr_prefix):
+                    break
+                if other_idx is None or idx < other_idx:
+                    other_idx = idx
 
         # If such commit does not exist - just append formatted commit to the
         # storage
-        if other_idx == -1:
+        if other_idx is None:
+            idx = len(storage)
             storage.append(formatted_commit)
+
+            pr_numbers_matched = FORMATTED_COMMIT_PR_NUMBERS_RE.search(
+                formatted_commit
+            )
+            if pr_numbers_matched:
+                bisect.insort(index, (formatted_commit, idx))
+                pr_numbers[idx] = set(
+                    pr_numbers_matched["pr_numbers"].split(", ")
+                )
+            continue
+
+        # Otherwise, merge commit message of other commit and current commit,
+        # if other commit does not mention same PR number yet
+        if pr_number in pr_numbers[other_idx]:
             continue
 
-        # Otherwise, merge commit message of other commit and current commit
-        pr_number = with_pr_data["pr_number"]
-        storage[other_idx] = f"{storage[other_idx][:-1]}, #{pr_number})"
+        other_commit = storage[other_idx]
+        merged_commit = f"{other_commit[:-1]}, {pr_number})"
+
+        del index[bisect.bisect_left(index, (other_commit, other_idx))]
+        bisect.insort(index, (merged_commit, other_idx))
+        pr_numbers[other_idx].add(pr_number)
+
+        seen.add(merged_commit)
+        storage[other_idx] = merged_commit
 
     return storage
 
 
+def restore_commit(*values: object) -> ConventionalCommit:
+    commit = object.__new__(ConventionalCommit)
+    for setter, value in zip(COMMIT_FIELD_SETTERS, values):
+        setter(commit, value)
+    return commit
+
+
 def rst_h1(value: str) -> str:
     return rst_header(value, symbol="=")
 
@@ -359,10 +691,11 @@ def version_header(
     *,
     include_date: bool,
     is_pre_release: bool,
+    now: Union[datetime.datetime, None] = None,
 ) -> str:
     content = version
     if include_date:
-        now = utcnow_naive()
+        now = now or utcnow_naive()
         content = f"{version} ({now.date().isoformat()})"
 
     is_rst = format_type == FormatTypeEnum.rst
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Union
+
+from badabump.changelog import (
+    BREAKING_CHANGE_IN_BODY,
+    ChangeLog,
+    COMMIT_TYPE_FEATURE,
+    ConventionalCommit,
+)
+from badabump.cli.commands import (
+    find_last_tag,
+    run_post_bump_hook,
+    update_changelog_file,
+    update_version_files,
+)
+from badabump.cli.output import echo_value, EMPTY, github_actions_output
+from badabump.commit_cache import (
+    CommitCache,
+    get_default_commit_cache_path,
+    parse_commits,
+)
+from badabump.configs import ProjectConfig, UpdateConfig
+from badabump.constants import (
+    INITIAL_PRE_RELEASE_COMMIT,
+    INITIAL_RELEASE_COMMIT,
+)
+from badabump.directory_index import DIRECTORY_INDEX
+from badabump.enums import ChangeLogTypeEnum
+from badabump.git import Git
+from badabump.loaders import FILE_CACHE
+from badabump.versions import Version
+
+if TYPE_CHECKING:
+    import argparse
+
+
+def bump(args: argparse.Namespace) -> int:
+    """Bump project version & update changelog due to parsed arguments."""
+    # Initialize project config from fresh snapshot of project files
+    DIRECTORY_INDEX.clear()
+    FILE_CACHE.clear()
+    project_config = ProjectConfig.from_path(args.path)
+
+    # Read latest git tag and parse current version
+    git = Git(path=project_config.path)
+
+    current_tag = find_last_tag(project_config, git)
+    echo_value(
+        "Current tag: ",
+        current_tag or EMPTY,
+        is_ci=args.is_ci,
+        ci_name="current_tag",
+    )
+
+    current_version: Union[Version, None] = None
+    if current_tag is not None:
+        current_version = Version.from_tag(current_tag, config=project_config)
+
+    echo_value(
+        "Current version: ",
+        (
+            current_version.format(config=project_config)
+            if current_version
+            else EMPTY
+        ),
+        is_ci=args.is_ci,
+        ci_name="current_version",
+    )
+
+    # Guess next version without reading all commits
+    if args.is_version_only:
+        return echo_next_version(
+            git,
+            project_config,
+            current_tag,
+            current_version,
+            is_ci=args.is_ci,
+            is_pre_release=args.is_pre_release,
+        )
+
+    # Read commits from last tag
+    if current_tag is not None and current_version is not None:
+        # Create changelog using commits from last tag, oldest first
+        if args.commit_cache is None:
+            changelog = ChangeLog.from_chronological_git_commits(
+                git.iter_commits(current_tag, reverse=True),
+                strict=project_config.strict_mode,
+            )
+        else:
+            commit_cache = CommitCache.load(
+                Path(args.commit_cache)
+                if args.commit_cache
+                else get_default_commit_cache_path(git)
+            )
+            changelog = ChangeLog(
+                commits=parse_commits(
+                    git,
+                    git.list_commit_ids(current_tag, reverse=True),
+                    cache=commit_cache,
+                    strict=project_config.strict_mode,
+                )
+            )
+            commit_cache.save()
+
+        if not changelog.commits and current_version.pre_release is None:
+            print(
+                f"ERROR: No commits found after: {current_tag!r}. Exit...",
+                file=sys.stderr,
+            )
+            return 1
+
+        # Supply update config and guess next version
+        update_config = create_update_config(changelog, args.is_pre_release)
+
+        # Guess next version
+        next_version = current_version.update(update_config)
+    # Create initial changelog
+    else:
+        next_version = Version.guess_initial_version(
+            config=project_config, is_pre_release=args.is_pre_release
+        )
+        changelog = ChangeLog.from_git_commits(
+            (
+                (
+                    INITIAL_PRE_RELEASE_COMMIT
+                    if next_version.pre_release is not None
+                    else INITIAL_RELEASE_COMMIT
+                ),
+            ),
+        )
+
+    git_changelog = changelog.format(
+        ChangeLogTypeEnum.git_commit,
+        project_config.changelog_format_type_git,
+        ignore_footer_urls=project_config.changelog_ignore_footer_urls,
+    )
+    echo_value(
+        "\nChangeLog\n\n",
+        git_changelog,
+        is_ci=args.is_ci,
+        ci_name="changelog",
+    )
+
+    next_version_str = next_version.format(config=project_config)
+    echo_value(
+        "\nNext version: ",
+        next_version_str,
+        is_ci=args.is_ci,
+        ci_name="next_version",
+    )
+
+    # Applying changes to version files
+    if not args.is_ci and not args.is_dry_run:
+        update_message = (
+            "Are you sure to update version files and changelog? [y/N] "
+        )
+        if input(update_message).lower() != "y":
+            print("OK! OK! Exit...")
+            return 0
+
+    update_version_files(
+        project_config,
+        current_version,
+        next_version,
+        is_dry_run=args.is_dry_run,
+    )
+
+    # Run post-bump hook
+    run_post_bump_hook(project_config, is_dry_run=args.is_dry_run)
+
+    # Update changelog
+    update_changelog_file(
+        project_config, next_version, changelog, is_dry_run=args.is_dry_run
+    )
+
+    # Supply necessary CI output
+    if args.is_ci:
+        github_actions_output(
+            "next_tag",
+            project_config.tag_format.format(version=next_version_str),
+        )
+        github_actions_output(
+            "next_tag_message",
+            "\n\n".join(
+                (
+                    project_config.tag_subject_format.format(
+                        version=next_version_str
+                    ),
+                    git_changelog,
+                )
+            ),
+        )
+        github_actions_output(
+            "pr_branch",
+            project_config.pr_branch_format.format(version=next_version_str),
+        )
+        github_actions_output(
+            "pr_title",
+            project_config.pr_title_format.format(version=next_version_str),
+        )
+
+    print("All OK!")
+    return 0
+
+
+def create_update_config(
+    changelog: ChangeLog, is_pre_release: bool
+) -> UpdateConfig:
+    kwargs = {
+        "is_breaking_change": False,
+        "is_minor_change": False,
+        "is_micro_change": False,
+        "is_pre_release": is_pre_release,
+    }
+
+    if changelog.has_breaking_change:
+        kwargs["is_breaking_change"] = True
+    elif changelog.has_minor_change:
+        kwargs["is_minor_change"] = True
+    else:
+        kwargs["is_micro_change"] = True
+
+    return UpdateConfig(**kwargs)
+
+
+def echo_next_version(
+    git: Git,
+    project_config: ProjectConfig,
+    current_tag: Union[str, None],
+    current_version: Union[Version, None],
+    *,
+    is_ci: bool,
+    is_pre_release: bool,
+) -> int:
+    if current_tag is not None and current_version is not None:
+        update_config = guess_update_config(
+            git,
+            current_tag,
+            is_pre_release=is_pre_release,
+            strict=project_config.strict_mode,
+        )
+        if update_config is None:
+            if current_version.pre_release is None:
+                print(
+                    f"ERROR: No commits found after: {current_tag!r}. Exit...",
+                    file=sys.stderr,
+                )
+                return 1
+            update_config = UpdateConfig(is_pre_release=is_pre_release)
+
+        next_version = current_version.update(update_config)
+    else:
+        next_version = Version.guess_initial_version(
+            config=project_config, is_pre_release=is_pre_release
+        )
+
+    echo_value(
+        "Next version: ",
+        next_version.format(config=project_config),
+        is_ci=is_ci,
+        ci_name="next_version",
+    )
+    return 0
+
+
+def guess_update_config(
+    git: Git, from_ref: str, *, is_pre_release: bool, strict: bool = True
+) -> Union[UpdateConfig, None]:
+    """Guess update config for commits after given ref without changelog.
+
+    Only commit subjects are parsed, while breaking changes in commit bodies
+    are searched by git itself. Scanning stops on first found breaking
+    change. Return None if there are no commits after given ref.
+    """
+    has_commits = has_minor_change = False
+
+    for subject in git.iter_commit_subjects(from_ref):
+        has_commits = True
+        commit = ConventionalCommit.from_git_commit(subject, strict=strict)
+        if commit.is_breaking_change:
+            return UpdateConfig(
+                is_breaking_change=True,
+                is_micro_change=False,
+                is_pre_release=is_pre_release,
+            )
+        if commit.commit_type == COMMIT_TYPE_FEATURE:
+            has_minor_change = True
+
+    if not has_commits:
+        return None
+
+    # Git matches string in whole commit message, so ensure it is a breaking
+    # change indeed
+    for git_commit in git.iter_commits(from_ref, grep=BREAKING_CHANGE_IN_BODY):
+        commit = ConventionalCommit.from_git_commit(git_commit, strict=False)
+        if commit.is_breaking_change:
+            return UpdateConfig(
+                is_breaking_change=True,
+                is_micro_change=False,
+                is_pre_release=is_pre_release,
+            )
+
+    return UpdateConfig(
+        is_minor_change=has_minor_change,
+        is_micro_change=not has_minor_change,
+        is_pre_release=is_pre_release,
+    )
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import sys
 from typing import cast, TYPE_CHECKING, Union
@@ -10,13 +9,12 @@ from badabump import __app__, __version__
 from badabump.cleaners import clean_body, clean_commit_subject, clean_tag_ref
 from badabump.cli.arguments import add_path_argument
 from badabump.cli.output import github_actions_output
-from badabump.configs import ProjectConfig
-from badabump.git import Git
+from badabump.enums import GitBackendEnum
 from badabump.regexps import to_regexp
-from badabump.versions import Version
 
 if TYPE_CHECKING:
     from badabump.annotations import Argv
+    from badabump.configs import ProjectConfig
 
 
 def parse_args(argv: Argv) -> argparse.Namespace:
@@ -50,7 +48,10 @@ def parse_args(argv: Argv) -> argparse.Namespace:
 
 
 def prepare_release(args: argparse.Namespace, *, config: ProjectConfig) -> int:
-    git = Git(path=config.path)
+    import json
+
+    from badabump.git import Git
+    from badabump.versions import Version
 
     tag_ref = clean_tag_ref(args.ref)
     version = Version.from_tag(tag_ref, config=config)
@@ -59,18 +60,22 @@ def prepare_release(args: argparse.Namespace, *, config: ProjectConfig) -> int:
         "is_pre_release", json.dumps(version.pre_release is not None)
     )
 
-    tag_subject = git.retrieve_tag_subject(tag_ref)
-    github_actions_output("release_name", tag_subject)
+    with Git(path=config.path, backend=GitBackendEnum.object_store) as git:
+        tag_subject = git.retrieve_tag_subject(tag_ref)
+        github_actions_output("release_name", tag_subject)
 
-    tag_body = git.retrieve_tag_body(tag_ref)
-    github_actions_output("release_body", tag_body)
+        tag_body = git.retrieve_tag_body(tag_ref)
+        github_actions_output("release_body", tag_body)
 
     return 0
 
 
 def prepare_tag(args: argparse.Namespace, *, config: ProjectConfig) -> int:
-    git = Git(path=config.path)
-    git_commit = git.retrieve_last_commit()
+    from badabump.git import Git
+
+    with Git(path=config.path, backend=GitBackendEnum.object_store) as git:
+        git_commit = git.retrieve_last_commit()
+
     try:
         raw_subject, _, *body = git_commit.splitlines()
     except ValueError:
@@ -113,5 +118,13 @@ def main(argv: Union[Argv, None] = None) -> int:
         )
         return 1
 
+    # Import modules, needed for running subcommands, only after parsing
+    # arguments, so --help or --version calls do not pay for importing them
+    from badabump.configs import ProjectConfig
+    from badabump.directory_index import DIRECTORY_INDEX
+    from badabump.loaders import FILE_CACHE
+
+    DIRECTORY_INDEX.clear()
+    FILE_CACHE.clear()
     config = ProjectConfig.from_path(args.path)
     return cast("int", args.func(args, config=config))
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import io
 import itertools
+import mmap
+import os
+import shutil
 import subprocess
-from typing import TYPE_CHECKING, Union
+import tempfile
+from contextlib import suppress
+from typing import cast, IO, TYPE_CHECKING, Union
 
 from badabump.changelog import in_development_header, version_header
-from badabump.cli.output import diff, echo_message
+from badabump.cli.output import diff, DIFF_MAX_SIZE, echo_message
 from badabump.configs import find_changelog_file
 from badabump.constants import (
     CHANGELOG_UPPER,
@@ -14,18 +20,30 @@ from badabump.constants import (
     FILE_PYPROJECT_TOML,
     FILE_YARN_LOCK,
 )
-from badabump.enums import ChangeLogTypeEnum, FormatTypeEnum, ProjectTypeEnum
+from badabump.directory_index import DIRECTORY_INDEX
+from badabump.enums import (
+    ChangeLogTypeEnum,
+    FormatTypeEnum,
+    ProjectTypeEnum,
+    TagStrategyEnum,
+)
 from badabump.exceptions import ConfigError
-from badabump.loaders import get_pyproject_toml_metadata, loads_toml
+from badabump.loaders import get_pyproject_toml_metadata, load_toml_file
+from badabump.regexps import to_glob
+from badabump.versions.version import parse_tags
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
     from badabump.changelog import ChangeLog
     from badabump.configs import ProjectConfig
+    from badabump.git import Git
     from badabump.versions import Version
 
+FILE_CHUNK_SIZE = 1024 * 1024
+FILE_ENCODING = "utf-8"
+
 
 def find_changelog_path(config: ProjectConfig) -> Path:
     path = config.path
@@ -43,6 +61,25 @@ def find_changelog_path(config: ProjectConfig) -> Path:
     return path / default_file
 
 
+def find_last_tag(config: ProjectConfig, git: Git) -> Union[str, None]:
+    """Find last tag of the project, using configured tag strategy.
+
+    With refs strategy, only tags, which match tag format & are merged into
+    HEAD, are listed, and tag with highest version is returned.
+    """
+    if config.tag_strategy == TagStrategyEnum.describe:
+        return git.retrieve_last_tag_or_none()
+
+    with suppress(subprocess.CalledProcessError):
+        parsed = parse_tags(
+            git.list_merged_tags(to_glob(config.tag_format)), config
+        )
+        if parsed:
+            return parsed[-1][0]
+
+    return None
+
+
 def format_version_str(item: Path, version_str: str) -> str:
     if item.name == "pyproject.toml":
         return f'version = "{version_str}"'
@@ -60,11 +97,10 @@ def guess_version_files(config: ProjectConfig) -> tuple[str, ...]:
     path = config.path
     version_files = []
 
-    maybe_pyproject_toml_path = path / FILE_PYPROJECT_TOML
-    if maybe_pyproject_toml_path.exists():
+    pyproject_toml = load_toml_file(path / FILE_PYPROJECT_TOML)
+    if pyproject_toml is not None:
         version_files.append(FILE_PYPROJECT_TOML)
 
-        pyproject_toml = loads_toml(maybe_pyproject_toml_path.read_text())
         real_project_name = get_pyproject_toml_metadata(pyproject_toml, "name")
 
         if real_project_name:
@@ -74,15 +110,21 @@ def guess_version_files(config: ProjectConfig) -> tuple[str, ...]:
                 package_path = path / package if package else path
                 prefix = f"{package}/" if package else ""
 
-                if (package_path / project_name / "__init__.py").exists():
-                    version_files.append(f"{prefix}{project_name}/__init__.py")
-
-                if (package_path / project_name / "__version__.py").exists():
-                    version_files.append(
-                        f"{prefix}{project_name}/__version__.py"
+                if DIRECTORY_INDEX.is_dir(package_path / project_name):
+                    names = DIRECTORY_INDEX.list_names(
+                        package_path / project_name
                     )
+                    if "__init__.py" in names:
+                        version_files.append(
+                            f"{prefix}{project_name}/__init__.py"
+                        )
+
+                    if "__version__.py" in names:
+                        version_files.append(
+                            f"{prefix}{project_name}/__version__.py"
+                        )
 
-                if (package_path / f"{project_name}.py").exists():
+                if DIRECTORY_INDEX.exists(package_path / f"{project_name}.py"):
                     version_files.append(f"{prefix}{project_name}.py")
 
     return tuple(version_files)
@@ -94,6 +136,81 @@ def iter_python_project_names(project_name: str) -> Iterator[str]:
         yield project_name.replace("-", "_")
 
 
+def find_file_content(
+    path: Path, *values: str
+) -> Union[tuple[int, int], None]:
+    """Find first occurrence of any of given values in the file.
+
+    File is searched via mmap, without decoding it. Return start & end byte
+    offsets of found value, or None if neither of values found.
+    """
+    with open(path, "rb") as handler:
+        if os.fstat(handler.fileno()).st_size == 0:
+            return None
+
+        with mmap.mmap(
+            handler.fileno(), 0, access=mmap.ACCESS_READ
+        ) as content:
+            found: list[tuple[int, int]] = []
+            for value in values:
+                encoded = value.encode(FILE_ENCODING)
+                start = content.find(encoded)
+                if start != -1:
+                    found.append((start, start + len(encoded)))
+
+    return min(found) if found else None
+
+
+def rewrite_file(
+    path: Path,
+    rewrite_head: Callable[[str, IO[str]], None],
+    *,
+    head_size: int = 0,
+) -> None:
+    """Rewrite head of the file, keeping rest of its content as is.
+
+    Only first ``head_size`` bytes of the file are read into memory and passed
+    to ``rewrite_head`` callback, which writes next head into the temporary
+    file. Rest of the file is then copied in chunks and the temporary file
+    atomically replaces the original one.
+
+    Callback reads & writes ``"\n"`` newlines, which are translated from & to
+    the newlines of the file, guessed by its first line.
+    """
+    with (
+        open(path, "rb") as handler,
+        tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f".{path.name}.", delete=False
+        ) as temp_handler,
+    ):
+        try:
+            newline = (
+                "\r\n"
+                if handler.readline(FILE_CHUNK_SIZE).endswith(b"\r\n")
+                else "\n"
+            )
+            handler.seek(0)
+
+            stream = io.TextIOWrapper(
+                cast("IO[bytes]", temp_handler),
+                encoding=FILE_ENCODING,
+                newline=newline,
+            )
+            head = handler.read(head_size).decode(FILE_ENCODING)
+            rewrite_head(head.replace(newline, "\n"), stream)
+            stream.flush()
+            stream.detach()
+
+            shutil.copyfileobj(handler, temp_handler, FILE_CHUNK_SIZE)
+        except BaseException:
+            temp_handler.close()
+            os.unlink(temp_handler.name)
+            raise
+
+    shutil.copymode(path, temp_handler.name)
+    os.replace(temp_handler.name, path)
+
+
 def run_post_bump_hook(
     config: ProjectConfig, *, is_dry_run: bool = False
 ) -> None:
@@ -107,9 +224,9 @@ def run_post_bump_hook(
     cmd = config.post_bump_hook
 
     if cmd is None and config.project_type == ProjectTypeEnum.javascript:
-        if (path / FILE_PACKAGE_LOCK_JSON).exists():
+        if DIRECTORY_INDEX.exists(path / FILE_PACKAGE_LOCK_JSON):
             cmd = "npm install"
-        elif (path / FILE_YARN_LOCK).exists():
+        elif DIRECTORY_INDEX.exists(path / FILE_YARN_LOCK):
             cmd = "yarn install"
 
     if cmd is None:
@@ -146,52 +263,72 @@ def update_changelog_file(
     if is_dry_run:
         return
 
+    format_type = config.changelog_format_type_file
+    is_pre_release = next_version.pre_release is not None
+
     dev_header = in_development_header(
-        next_version.version.format(), config.changelog_format_type_file
+        next_version.version.format(), format_type
     )
-    changelog_content = changelog.format(
-        ChangeLogTypeEnum.changelog_file,
-        config.changelog_format_type_file,
-        is_pre_release=next_version.pre_release is not None,
+    headers: tuple[str, ...] = (
+        version_header(
+            next_version_str,
+            format_type,
+            is_pre_release=is_pre_release,
+            include_date=config.changelog_file_include_date,
+        ),
     )
-
-    if next_version.pre_release is None:
-        next_version_changelog = "\n\n".join(
-            (
-                version_header(
-                    next_version_str,
-                    config.changelog_format_type_file,
-                    is_pre_release=False,
-                    include_date=config.changelog_file_include_date,
-                ),
-                changelog_content,
-            )
-        )
-    else:
-        next_version_changelog = "\n\n".join(
-            (
-                dev_header,
-                version_header(
-                    next_version_str,
-                    config.changelog_format_type_file,
-                    is_pre_release=True,
-                    include_date=config.changelog_file_include_date,
-                ),
-                changelog_content,
-            )
+    if is_pre_release:
+        headers = (dev_header, *headers)
+
+    def write_release_notes(stream: IO[str]) -> None:
+        for header in headers:
+            stream.write(f"{header}\n\n")
+        changelog.write(
+            stream,
+            ChangeLogTypeEnum.changelog_file,
+            format_type,
+            is_pre_release=is_pre_release,
         )
 
-    next_version_changelog = f"{next_version_changelog}\n\n"
+    def prepend_head(head: str, stream: IO[str]) -> None:
+        write_release_notes(stream)
+        stream.write("\n\n")
+
+    def replace_head(head: str, stream: IO[str]) -> None:
+        # Head contains In Development header, followed by empty line
+        prefix, _, rest = head.partition(f"{dev_header}\n\n")
+
+        release_notes = io.StringIO()
+        release_notes.write(prefix)
+        write_release_notes(release_notes)
+        release_notes.write("\n\n")
+        release_notes.write(rest)
+
+        next_head = release_notes.getvalue()
+        echo_message(diff(head, next_head), is_dry_run=False)
+        stream.write(next_head)
 
     if not changelog_path.exists():
-        changelog_path.write_text(f"{next_version_changelog.strip()}\n")
+        with open(changelog_path, "w", encoding=FILE_ENCODING) as handler:
+            write_release_notes(handler)
+            handler.write("\n")
+        return
+
+    # Replace In Development header with release notes, if it is present,
+    # otherwise prepend release notes on top of the file
+    maybe_found = find_file_content(
+        changelog_path, f"{dev_header}\n\n", f"{dev_header}\r\n\r\n"
+    )
+    if maybe_found is not None:
+        # Read small changelog file as a whole to show its full diff
+        size = changelog_path.stat().st_size
+        rewrite_file(
+            changelog_path,
+            replace_head,
+            head_size=size if size <= DIFF_MAX_SIZE else maybe_found[1],
+        )
     else:
-        if not update_file(
-            changelog_path, f"{dev_header}\n\n", next_version_changelog
-        ):
-            changelog_path.write_text(
-                "".join((next_version_changelog, changelog_path.read_text()))
-            )
+        rewrite_file(changelog_path, prepend_head)
 
 
 def update_file(
@@ -209,7 +346,6 @@ def update_file(
     if not path.exists():
         return False
 
-    # TODO: Do not read whole file output for make replacement
     content = path.read_text()
     if current_content not in content:
         return False
@@ -1,15 +1,58 @@
+from __future__ import annotations
+
 import os
-from difflib import ndiff
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+DIFF_CONTEXT_LINES = 3
+DIFF_MAX_SIZE = 64 * 1024
 
 EMPTY = "-"
 
 
-def diff(current_content: str, next_content: str) -> str:
-    items = ndiff(
-        current_content.splitlines(keepends=True),
-        next_content.splitlines(keepends=True),
-    )
+def diff(
+    current_content: str,
+    next_content: str,
+    *,
+    max_size: int = DIFF_MAX_SIZE,
+) -> str:
+    """Show changed lines between current & next content.
+
+    If both contents are not larger than ``max_size`` characters, they are
+    passed to ``ndiff`` as is. Otherwise, only edit region (changed lines and
+    few context lines around) is passed to ``ndiff``, and if edit region is
+    larger than ``max_size`` characters as well, only summary of changed
+    lines is shown.
+    """
+    from difflib import ndiff
+
+    current_lines = current_content.splitlines(keepends=True)
+    next_lines = next_content.splitlines(keepends=True)
+
+    if len(current_content) <= max_size and len(next_content) <= max_size:
+        items = ndiff(current_lines, next_lines)
+    else:
+        start, current_end, next_end = find_edit_region(
+            current_lines, next_lines
+        )
+        size = sum(map(len, current_lines[start:current_end])) + sum(
+            map(len, next_lines[start:next_end])
+        )
+        if size > max_size:
+            return (
+                f"Diff is too large to show: {current_end - start} line(s) "
+                f"removed, {next_end - start} line(s) added after line "
+                f"{start}\n"
+            )
+
+        context_start = max(start - DIFF_CONTEXT_LINES, 0)
+        items = ndiff(
+            current_lines[context_start : current_end + DIFF_CONTEXT_LINES],
+            next_lines[context_start : next_end + DIFF_CONTEXT_LINES],
+        )
+
     return "".join(item for item in items if item.startswith(("-", "+", "?")))
 
 
@@ -31,6 +74,31 @@ def echo_value(
         print(f"{label}{value}")
 
 
+def find_edit_region(
+    current_lines: Sequence[str], next_lines: Sequence[str]
+) -> tuple[int, int, int]:
+    """Find region of lines, which differ in current & next lines.
+
+    Return index of first changed line, and end indexes of changed lines in
+    current & next lines.
+    """
+    max_start = min(len(current_lines), len(next_lines))
+    start = 0
+    while start < max_start and current_lines[start] == next_lines[start]:
+        start += 1
+
+    current_end, next_end = len(current_lines), len(next_lines)
+    while (
+        current_end > start
+        and next_end > start
+        and current_lines[current_end - 1] == next_lines[next_end - 1]
+    ):
+        current_end -= 1
+        next_end -= 1
+
+    return (start, current_end, next_end)
+
+
 def github_actions_output(name: str, value: str) -> None:
     with open(os.environ["GITHUB_OUTPUT"], "a+") as github_output_handler:
         github_output_handler.write(f"{name}<<EOF\n")
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Union
+
+from badabump import __app__
+from badabump.changelog import COMMIT_TYPE_UNKNOWN, ConventionalCommit
+from badabump.constants import COMMIT_CACHE_FILE, DEFAULT_COMMIT_CACHE_SIZE
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from typing_extensions import Self
+
+    from badabump.git import Git
+
+COMMIT_CACHE_HEADER = f"# {__app__} commit cache v1"
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class CommitCache:
+    """Parsed conventional commits, keyed by commit ID.
+
+    Cache is stored as plain text file: header line, followed by one
+    ``<commit ID>\\t<JSON array of commit fields>`` line per commit, least
+    recently used first. Only ``max_size`` most recently used commits are
+    kept.
+    """
+
+    path: Path
+    max_size: int = DEFAULT_COMMIT_CACHE_SIZE
+
+    entries: OrderedDict[str, ConventionalCommit] = dataclasses.field(
+        default_factory=OrderedDict, repr=False
+    )
+
+    def __contains__(self, commit_id: str) -> bool:
+        return commit_id in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, commit_id: str) -> Union[ConventionalCommit, None]:
+        maybe_commit = self.entries.get(commit_id)
+        if maybe_commit is not None:
+            self.entries.move_to_end(commit_id)
+        return maybe_commit
+
+    @classmethod
+    def load(
+        cls, path: Path, *, max_size: int = DEFAULT_COMMIT_CACHE_SIZE
+    ) -> Self:
+        """Load commit cache from given path.
+
+        Missing file, file with unexpected header or malformed lines are not
+        errors, as cache will be populated again on next run.
+        """
+        cache = cls(path=path, max_size=max_size)
+        if not path.exists():
+            return cache
+
+        with open(path, encoding="utf-8") as handler:
+            if handler.readline().rstrip("\n") != COMMIT_CACHE_HEADER:
+                return cache
+
+            for line in handler:
+                maybe_item = parse_cache_line(line)
+                if maybe_item is not None:
+                    cache.set(*maybe_item)
+
+        return cache
+
+    def save(self) -> None:
+        """Atomically write commit cache to its path."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=self.path.parent,
+            prefix=f".{self.path.name}.",
+            delete=False,
+        ) as handler:
+            handler.write(f"{COMMIT_CACHE_HEADER}\n")
+            for commit_id, commit in self.entries.items():
+                handler.write(format_cache_line(commit_id, commit))
+
+        os.replace(handler.name, self.path)
+
+    def set(  # noqa: A003
+        self, commit_id: str, commit: ConventionalCommit
+    ) -> None:
+        self.entries[commit_id] = commit
+        self.entries.move_to_end(commit_id)
+
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+
+def format_cache_line(commit_id: str, commit: ConventionalCommit) -> str:
+    fields = json.dumps(
+        [commit.raw_commit_type, commit.description, commit.body],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return f"{commit_id}\t{fields}\n"
+
+
+def get_default_commit_cache_path(git: Git) -> Path:
+    return Path(git.retrieve_git_dir()) / __app__ / COMMIT_CACHE_FILE
+
+
+def parse_commits(
+    git: Git,
+    commit_ids: Sequence[str],
+    *,
+    cache: CommitCache,
+    strict: bool = True,
+) -> tuple[ConventionalCommit, ...]:
+    """Parse given commits, keeping their order.
+
+    Only commits, which are missing in the cache, are retrieved from git &
+    parsed. Commits, which are not conventional, are never cached, as result
+    of their parsing depends on ``strict`` flag.
+    """
+    commits: dict[str, ConventionalCommit] = {}
+    missing_ids: list[str] = []
+    for commit_id in commit_ids:
+        maybe_commit = cache.get(commit_id)
+        if maybe_commit is not None:
+            commits[commit_id] = maybe_commit
+        else:
+            missing_ids.append(commit_id)
+
+    for commit_id, git_commit in zip(
+        missing_ids, git.retrieve_commits(missing_ids)
+    ):
+        commit = ConventionalCommit.from_git_commit(git_commit, strict=strict)
+        commits[commit_id] = commit
+
+        if commit.raw_commit_type != COMMIT_TYPE_UNKNOWN:
+            cache.set(commit_id, commit)
+
+    return tuple(commits[item] for item in commit_ids)
+
+
+def parse_cache_line(line: str) -> Union[tuple[str, ConventionalCommit], None]:
+    commit_id, _, fields = line.partition("\t")
+    try:
+        raw_commit_type, description, body = json.loads(fields)
+    except (TypeError, ValueError):
+        return None
+
+    if (
+        not commit_id
+        or not isinstance(raw_commit_type, str)
+        or not raw_commit_type
+        or not isinstance(description, str)
+        or not isinstance(body, (str, type(None)))
+    ):
+        return None
+
+    return (
+        commit_id,
+        ConventionalCommit(
+            raw_commit_type=raw_commit_type,
+            description=description,
+            body=body,
+        ),
+    )
@@ -17,12 +17,19 @@ from badabump.constants import (
     DEFAULT_SEMVER_SCHEMA,
     DEFAULT_STRICT_MODE,
     DEFAULT_TAG_FORMAT,
+    DEFAULT_TAG_STRATEGY,
     DEFAULT_TAG_SUBJECT_FORMAT,
     DEFAULT_VERSION_SCHEMA,
     DEFAULT_VERSION_TYPE,
 )
-from badabump.enums import FormatTypeEnum, ProjectTypeEnum, VersionTypeEnum
-from badabump.loaders import loads_toml
+from badabump.directory_index import DIRECTORY_INDEX
+from badabump.enums import (
+    FormatTypeEnum,
+    ProjectTypeEnum,
+    TagStrategyEnum,
+    VersionTypeEnum,
+)
+from badabump.loaders import load_toml_file
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -41,6 +48,7 @@ class ProjectConfig:
     version_files: tuple[str, ...] = dataclasses.field(default_factory=tuple)
 
     tag_format: str = DEFAULT_TAG_FORMAT
+    tag_strategy: TagStrategyEnum = DEFAULT_TAG_STRATEGY
     tag_subject_format: str = DEFAULT_TAG_SUBJECT_FORMAT
     pr_branch_format: str = DEFAULT_PR_BRANCH_FORMAT
     pr_title_format: str = DEFAULT_PR_TITLE_FORMAT
@@ -89,6 +97,7 @@ class ProjectConfig:
             ),
             version_files=tuple(config_data.get("version_files") or ()),
             tag_format=config_data.get("tag_format") or DEFAULT_TAG_FORMAT,
+            tag_strategy=guess_tag_strategy(config_data.get("tag_strategy")),
             tag_subject_format=(
                 config_data.get("tag_subject_format")
                 or DEFAULT_TAG_SUBJECT_FORMAT
@@ -139,7 +148,7 @@ class UpdateConfig:
 
 
 def find_changelog_file(path: Path, pattern: str) -> Union[Path, None]:
-    for item in path.glob(pattern):
+    for item in DIRECTORY_INDEX.iter_matches(path, pattern):
         if item.stem.lower() == CHANGELOG_LOWER:
             return item
     return None
@@ -170,12 +179,18 @@ def guess_project_type(value: Union[str, None], path: Path) -> ProjectTypeEnum:
     if value:
         return ProjectTypeEnum[value]
 
-    if (path / "package.json").exists():
+    if DIRECTORY_INDEX.exists(path / "package.json"):
         return ProjectTypeEnum.javascript
 
     return DEFAULT_PROJECT_TYPE
 
 
+def guess_tag_strategy(value: Union[str, None]) -> TagStrategyEnum:
+    if value:
+        return TagStrategyEnum[value]
+    return DEFAULT_TAG_STRATEGY
+
+
 def guess_version_type(value: Union[str, None]) -> VersionTypeEnum:
     if value:
         return VersionTypeEnum[value]
@@ -191,10 +206,10 @@ def load_project_config_data(
 ) -> Union[tuple[Path, DictStrAny], None]:
     for item in (f".{__app__}.toml", "pyproject.toml"):
         maybe_config_path = path / item
-        if not maybe_config_path.exists():
+        data = load_toml_file(maybe_config_path)
+        if data is None:
             continue
 
-        data = loads_toml(maybe_config_path.read_text())
         return (maybe_config_path, data.get("tool", {}).get(__app__, {}) or {})
 
     return None
@@ -1,5 +1,10 @@
 from badabump import __app__
-from badabump.enums import FormatTypeEnum, ProjectTypeEnum, VersionTypeEnum
+from badabump.enums import (
+    FormatTypeEnum,
+    ProjectTypeEnum,
+    TagStrategyEnum,
+    VersionTypeEnum,
+)
 
 CHANGELOG_UPPER = "CHANGELOG"
 CHANGELOG_LOWER = CHANGELOG_UPPER.lower()
@@ -10,6 +15,7 @@ DEFAULT_CHANGELOG_FORMAT_TYPE_GIT = FormatTypeEnum.markdown
 DEFAULT_CHANGELOG_IGNORE_FOOTER_URLS = True
 DEFAULT_PROJECT_TYPE = ProjectTypeEnum.python
 DEFAULT_TAG_FORMAT = "v{version}"
+DEFAULT_TAG_STRATEGY = TagStrategyEnum.describe
 DEFAULT_TAG_SUBJECT_FORMAT = "{version} Release"
 DEFAULT_PR_BRANCH_FORMAT = f"chore/release-{DEFAULT_TAG_FORMAT}"
 DEFAULT_PR_TITLE_FORMAT = f"chore: {DEFAULT_TAG_SUBJECT_FORMAT}"
@@ -22,6 +28,9 @@ DEFAULT_SEMVER_SCHEMA = "MAJOR.MINOR.PATCH"
 INITIAL_RELEASE_COMMIT = "feat: Initial release"
 INITIAL_PRE_RELEASE_COMMIT = "feat: Initial pre-release"
 
+COMMIT_CACHE_FILE = "commits.cache"
+DEFAULT_COMMIT_CACHE_SIZE = 10_000
+
 FILE_CONFIG_TOML = f".{__app__}.toml"
 FILE_PACKAGE_JSON = "package.json"
 FILE_PACKAGE_LOCK_JSON = "package-lock.json"
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+import time
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+# Directory mtime does not change, if its entries are added or removed within
+# same filesystem timestamp tick, as it has been scanned. Do not trust snapshots
+# of directories, which have been modified that recently before the scan
+MTIME_RESOLUTION_NS = 2_000_000_000
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class DirectoryIndex:
+    """Names of directory entries, keyed by directory path.
+
+    Each directory is scanned once via ``os.scandir`` and scanned again only
+    after its mtime changes, so all existence checks & pattern lookups within
+    project root or ``src/`` directory are answered from memory, while still
+    noticing entries, which have been added or removed in meantime.
+
+    Snapshots of recently modified directories are not trusted, and these
+    directories are scanned on each lookup.
+    """
+
+    entries: dict[Path, tuple[int, int, dict[str, bool]]] = dataclasses.field(
+        default_factory=dict, repr=False
+    )
+    scans: int = 0
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.scans = 0
+
+    def exists(self, path: Path) -> bool:
+        return path.name in self.list_names(path.parent)
+
+    def is_dir(self, path: Path) -> bool:
+        return self.list_names(path.parent).get(path.name, False)
+
+    def iter_matches(self, path: Path, pattern: str) -> Iterator[Path]:
+        """Iterate over directory entries, which names match the pattern."""
+        for name in self.list_names(path):
+            if fnmatchcase(name, pattern):
+                yield path / name
+
+    def list_names(self, path: Path) -> dict[str, bool]:
+        """List names of directory entries & whether they are directories.
+
+        Broken symlinks are not listed, same as ``Path.exists`` does not
+        report them. Return empty dict if path is not an existing directory.
+        """
+        try:
+            mtime = path.stat().st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+
+        maybe_entry = self.entries.get(path)
+        if (
+            maybe_entry is not None
+            and maybe_entry[0] == mtime
+            and maybe_entry[1] - mtime > MTIME_RESOLUTION_NS
+        ):
+            return maybe_entry[2]
+
+        scanned_at = time.time_ns()
+        try:
+            with os.scandir(path) as iterator:
+                names = {
+                    item.name: item.is_dir()
+                    for item in iterator
+                    if not item.is_symlink() or os.path.exists(item.path)
+                }
+        except NotADirectoryError:
+            names = {}
+
+        self.scans += 1
+        self.entries[path] = (mtime, scanned_at, names)
+        return names
+
+
+DIRECTORY_INDEX = DirectoryIndex()
@@ -13,12 +13,25 @@ class FormatTypeEnum(Enum):
     rst = "rst"
 
 
+@unique
+class GitBackendEnum(Enum):
+    subprocess = "subprocess"
+    cat_file = "cat_file"
+    object_store = "object_store"
+
+
 @unique
 class ProjectTypeEnum(Enum):
     python = "python"
     javascript = "javascript"
 
 
+@unique
+class TagStrategyEnum(Enum):
+    describe = "describe"
+    refs = "refs"
+
+
 @unique
 class VersionTypeEnum(Enum):
     calver = "calver"
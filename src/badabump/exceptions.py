@@ -4,3 +4,7 @@ class Error(Exception):
 
 class ConfigError(Error):
     """Something wrong with badabump configuration."""
+
+
+class ObjectStoreError(Error):
+    """Unable to read git repository data without calling git itself."""
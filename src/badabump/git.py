@@ -5,30 +5,254 @@ import subprocess
 from contextlib import suppress
 from typing import TYPE_CHECKING, Union
 
+from badabump.enums import GitBackendEnum
+from badabump.exceptions import ObjectStoreError
+from badabump.object_store import ObjectStore, parse_object_message
+
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Sequence
     from pathlib import Path
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+CHUNK_SIZE = 64 * 1024
+COMMIT_IDS_CHUNK_SIZE = 1000
+NUL = b"\0"
+
+SIGNATURE_STARTS = (
+    "-----BEGIN PGP SIGNATURE-----",
+    "-----BEGIN PGP MESSAGE-----",
+    "-----BEGIN SSH SIGNATURE-----",
+    "-----BEGIN SIGNED MESSAGE-----",
+)
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class CatFile:
+    """Long-lived ``git cat-file --batch`` process.
+
+    Process is started on first lookup and kept open until ``close`` call, so
+    multiple object lookups do not spawn multiple git processes.
+    """
+
+    path: Path
+
+    process: Union[subprocess.Popen[bytes], None] = dataclasses.field(
+        default=None, init=False, repr=False
+    )
+
+    def close(self) -> None:
+        process = self.process
+        if process is None:
+            return
+
+        self.process = None
+        if process.stdin is not None:
+            # Process may already exit, leaving unflushed input in the pipe
+            with suppress(BrokenPipeError):
+                process.stdin.close()
+        if process.stdout is not None:
+            process.stdout.close()
+        process.wait()
+
+    def read_object(self, name: str) -> Union[tuple[str, bytes], None]:
+        """Read type & content of git object by its name.
+
+        Return None if object is missing or its name is ambiguous.
+        """
+        if "\n" in name:
+            return None
+
+        process = self.process
+        if process is None:
+            process = self.process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+
+        stdin, stdout = process.stdin, process.stdout
+        if stdin is None or stdout is None:  # pragma: no cover
+            raise ValueError("git cat-file process has no pipes")
+
+        try:
+            stdin.write(f"{name}\n".encode("utf-8"))
+            stdin.flush()
+        except BrokenPipeError:
+            header = b""
+        else:
+            header = stdout.readline()
+        if not header:
+            raise ValueError("git cat-file process exited unexpectedly")
+
+        # Header is "<oid> <type> <size>" for existing objects, or
+        # "<name> missing" / "<name> ambiguous" otherwise
+        parts = header.rsplit(maxsplit=2)
+        if len(parts) != 3 or not parts[2].isdigit():
+            return None
+
+        content = stdout.read(int(parts[2]))
+        stdout.read(1)
+        return (parts[1].decode("utf-8"), content)
 
 
 @dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
 class Git:
     path: Path
+    backend: GitBackendEnum = GitBackendEnum.subprocess
+
+    reader: Union[CatFile, ObjectStore, None] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        reader: Union[CatFile, ObjectStore, None] = None
+        if self.backend == GitBackendEnum.cat_file:
+            reader = CatFile(path=self.path)
+        elif self.backend == GitBackendEnum.object_store:
+            # Unsupported repository layouts fallback to git subprocess
+            reader = ObjectStore.from_path(self.path)
+        object.__setattr__(self, "reader", reader)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Union[type[BaseException], None],
+        exc_value: Union[BaseException, None],
+        traceback: Union[TracebackType, None],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.reader is not None:
+            self.reader.close()
+
+    def iter_commit_subjects(self, from_ref: str) -> Iterator[str]:
+        """Iterate over subjects of commits after given ref, newest first.
+
+        Same as for ``%s`` format of ``git log``, subject is a first paragraph
+        of commit message, joined into one line.
+        """
+        if isinstance(self.reader, ObjectStore):
+            with suppress(ObjectStoreError):
+                return (
+                    " ".join(item.split("\n\n", 1)[0].splitlines())
+                    for item in self.reader.list_commits(from_ref)
+                )
+
+        return self._iter_output(
+            ["git", "log", "-z", "--format=%s", f"{from_ref}..HEAD"]
+        )
+
+    def iter_commits(
+        self,
+        from_ref: str,
+        *,
+        reverse: bool = False,
+        grep: Union[str, None] = None,
+    ) -> Iterator[str]:
+        """Iterate over messages of commits after given ref, newest first.
+
+        Messages are streamed from git output one by one, so whole history is
+        never kept in memory. Pass ``reverse=True`` to iterate over commits in
+        chronological order instead, and ``grep`` to only iterate over
+        commits, which messages contain given string.
+        """
+        if isinstance(self.reader, ObjectStore):
+            with suppress(ObjectStoreError):
+                commits = self.reader.list_commits(from_ref)
+                return (
+                    item
+                    for item in (commits[::-1] if reverse else commits)
+                    if grep is None or grep in item
+                )
+
+        return self._iter_output(
+            [
+                "git",
+                "log",
+                "-z",
+                "--format=%B",
+                *(("--reverse",) if reverse else ()),
+                *(("--fixed-strings", f"--grep={grep}") if grep else ()),
+                f"{from_ref}..HEAD",
+            ]
+        )
+
+    def list_commit_ids(
+        self, from_ref: str, *, reverse: bool = False
+    ) -> tuple[str, ...]:
+        return tuple(
+            self._iter_output(
+                [
+                    "git",
+                    "rev-list",
+                    *(("--reverse",) if reverse else ()),
+                    f"{from_ref}..HEAD",
+                ],
+                separator=b"\n",
+            )
+        )
 
     def list_commits(self, from_ref: str) -> tuple[str, ...]:
-        def iter_commtis(commit_ids: list[str]) -> Iterator[str]:
-            for commit_id in commit_ids:
-                yield self._check_output(
-                    ["git", "log", "-1", "--format=%B", commit_id]
+        return tuple(self.iter_commits(from_ref))
+
+    def retrieve_commits(self, commit_ids: Sequence[str]) -> tuple[str, ...]:
+        """Retrieve messages of given commits, keeping their order."""
+        commits: list[str] = []
+        for idx in range(0, len(commit_ids), COMMIT_IDS_CHUNK_SIZE):
+            commits.extend(
+                self._iter_output(
+                    [
+                        "git",
+                        "log",
+                        "--no-walk=unsorted",
+                        "-z",
+                        "--format=%B",
+                        *commit_ids[idx : idx + COMMIT_IDS_CHUNK_SIZE],
+                    ]
                 )
+            )
+        return tuple(commits)
 
-        commit_ids = self._check_output(
-            ["git", "log", "--format=%H", f"{from_ref}..HEAD"]
-        ).splitlines()
-        return tuple(iter_commtis(commit_ids))
+    def retrieve_git_dir(self) -> str:
+        return self._check_output(["git", "rev-parse", "--absolute-git-dir"])
 
     def retrieve_last_commit(self) -> str:
+        if self.reader is not None:
+            with suppress(ObjectStoreError):
+                maybe_object = self.reader.read_object("HEAD")
+                if maybe_object is None:
+                    raise ValueError("Unable to read last commit")
+                return parse_object_message(maybe_object[1])
+
         return self._check_output(["git", "log", "-1", "--format=%B"])
 
+    def list_merged_tags(
+        self, pattern: str, *, ref: str = "HEAD"
+    ) -> tuple[str, ...]:
+        """List tags, which match glob pattern & are reachable from ref.
+
+        Unlike ``git describe``, does not walk history, as all matching tags
+        are listed & filtered by ancestry within single git call.
+        """
+        return tuple(
+            self._iter_output(
+                [
+                    "git",
+                    "for-each-ref",
+                    f"--merged={ref}",
+                    "--format=%(refname:strip=2)",
+                    f"refs/tags/{pattern}",
+                ],
+                separator=b"\n",
+            )
+        )
+
     def retrieve_last_tag(self) -> str:
         return self._check_output(["git", "describe", "--abbrev=0", "--tags"])
 
@@ -38,11 +262,19 @@ class Git:
         return None
 
     def retrieve_tag_body(self, tag: str) -> str:
+        maybe_message = self._read_tag_message(tag)
+        if maybe_message is not None:
+            return maybe_message[1]
+
         return self._check_output(
             ["git", "tag", "-l", "--format=%(body)", tag]
         )
 
     def retrieve_tag_subject(self, tag: str) -> str:
+        maybe_message = self._read_tag_message(tag)
+        if maybe_message is not None:
+            return maybe_message[0]
+
         return self._check_output(
             ["git", "tag", "-l", "--format=%(subject)", tag]
         )
@@ -53,3 +285,88 @@ class Git:
             return maybe_output.strip().decode("utf-8")
 
         raise ValueError("git command return unexpected empty output")
+
+    def _iter_output(
+        self, args: list[str], *, separator: bytes = NUL
+    ) -> Iterator[str]:
+        """Stream output of git command, splitting it into records.
+
+        Each record is stripped & decoded the same way as within
+        ``_check_output``, so single git call with ``-z`` flag results in same
+        values as multiple calls for each object.
+        """
+        with subprocess.Popen(
+            args, cwd=self.path, stdout=subprocess.PIPE
+        ) as process:
+            stdout = process.stdout
+            if stdout is None:  # pragma: no cover
+                raise ValueError("git command return unexpected empty output")
+
+            pending: list[bytes] = []
+            while chunk := stdout.read(CHUNK_SIZE):
+                head, *records = chunk.split(separator)
+                pending.append(head)
+                if not records:
+                    continue
+
+                yield b"".join(pending).strip().decode("utf-8")
+                for record in records[:-1]:
+                    yield record.strip().decode("utf-8")
+                pending = [records[-1]]
+
+            # Output of ``--format`` is separator terminated, but in case it
+            # is not - do not lose last record
+            if any(pending):
+                yield b"".join(pending).strip().decode("utf-8")
+
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, args)
+
+    def _read_tag_message(self, tag: str) -> Union[tuple[str, str], None]:
+        """Read subject & body of the tag with enabled reader.
+
+        Return None if reader is not enabled or unable to read the tag, so git
+        subprocess should be used instead.
+        """
+        if self.reader is None:
+            return None
+
+        with suppress(ObjectStoreError):
+            maybe_object = self.reader.read_object(f"refs/tags/{tag}")
+            if maybe_object is None:
+                return ("", "")
+            return split_object_message(maybe_object[1])
+
+        return None
+
+
+def split_object_message(content: bytes) -> tuple[str, str]:
+    """Split message of commit or tag object into subject & body.
+
+    Mimic ``%(subject)`` & ``%(body)`` fields of ``git for-each-ref``: subject
+    is a first paragraph of the message (which ends before signature, if
+    any), joined into one line, while body is everything after it.
+    """
+    message = parse_object_message(content)
+
+    subject_end = message.find("\n\n")
+    signature_start = find_signature_start(message)
+    if subject_end == -1 or subject_end > signature_start:
+        subject_end = signature_start
+
+    return (
+        " ".join(message[:subject_end].splitlines()),
+        message[subject_end:].strip(),
+    )
+
+
+def find_signature_start(message: str) -> int:
+    for item in SIGNATURE_STARTS:
+        if message.startswith(item):
+            return 0
+
+        maybe_idx = message.rfind(f"\n{item}")
+        if maybe_idx != -1:
+            return maybe_idx + 1
+
+    return len(message)
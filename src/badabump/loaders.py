@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import dataclasses
+import json
 import sys
 from contextlib import suppress
 from typing import cast, TYPE_CHECKING, Union
@@ -10,9 +12,61 @@ else:
     import tomli as tomllib
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
     from badabump.annotations import DictStrAny
 
 
+@dataclasses.dataclass(slots=True, kw_only=True)
+class FileCache:
+    """Parsed project files, keyed by path & validated by mtime & size.
+
+    Allows to read & parse project files, such as ``pyproject.toml`` or
+    ``package.json``, only once per run, while still noticing files, which
+    have been updated in meantime.
+    """
+
+    entries: dict[Path, tuple[int, int, DictStrAny]] = dataclasses.field(
+        default_factory=dict, repr=False
+    )
+    hits: int = 0
+    misses: int = 0
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+    def load(
+        self, path: Path, loads: Callable[[str], DictStrAny]
+    ) -> Union[DictStrAny, None]:
+        """Load & parse file content, if file exists.
+
+        Parsed content is shared between all callers, and must not be
+        modified.
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        maybe_entry = self.entries.get(path)
+        if maybe_entry is not None and maybe_entry[:2] == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            self.hits += 1
+            return maybe_entry[2]
+
+        self.misses += 1
+        data = loads(path.read_text())
+        self.entries[path] = (stat.st_mtime_ns, stat.st_size, data)
+        return data
+
+
+FILE_CACHE = FileCache()
+
+
 def get_pyproject_toml_metadata(
     pyproject_toml: DictStrAny, key: str
 ) -> Union[str, None]:
@@ -26,5 +80,17 @@ def get_pyproject_toml_metadata(
         return None
 
 
+def load_json_file(path: Path) -> Union[DictStrAny, None]:
+    return FILE_CACHE.load(path, loads_json)
+
+
+def load_toml_file(path: Path) -> Union[DictStrAny, None]:
+    return FILE_CACHE.load(path, loads_toml)
+
+
+def loads_json(content: str) -> DictStrAny:
+    return cast("DictStrAny", json.loads(content))
+
+
 def loads_toml(content: str) -> DictStrAny:
     return tomllib.loads(content)
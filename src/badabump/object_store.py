@@ -0,0 +1,532 @@
+from __future__ import annotations
+
+import dataclasses
+import heapq
+import itertools
+import mmap
+import os
+import re
+import zlib
+from typing import TYPE_CHECKING, Union
+
+from badabump.exceptions import ObjectStoreError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from typing_extensions import Self
+
+CHUNK_SIZE = 64 * 1024
+
+GIT_ENV_VARS = (
+    "GIT_ALTERNATE_OBJECT_DIRECTORIES",
+    "GIT_COMMON_DIR",
+    "GIT_DIR",
+    "GIT_OBJECT_DIRECTORY",
+)
+
+ABBREV_OID_RE = re.compile(r"^[0-9a-fA-F]{4,39}$")
+HEX_OID_RE = re.compile(r"^[0-9a-f]{40}$")
+UNSAFE_REF_RE = re.compile(r"(^/|\.\.|@\{|//|[\s~^:?*\[\\])")
+UNSUPPORTED_EXTENSIONS_RE = re.compile(
+    r"^\s*(objectformat\s*=\s*(?!sha1\b)|refstorage\s*=\s*(?!files\b))",
+    re.I | re.M,
+)
+
+IDX_V2_HEADER = b"\377tOc\0\0\0\2"
+IDX_FANOUT_OFFSET = len(IDX_V2_HEADER)
+IDX_NAMES_OFFSET = IDX_FANOUT_OFFSET + 256 * 4
+IDX_LARGE_OFFSET_FLAG = 0x80000000
+
+OBJECT_TYPES = {1: "commit", 2: "tree", 3: "blob", 4: "tag"}
+OBJECT_TYPE_OFS_DELTA = 6
+OBJECT_TYPE_REF_DELTA = 7
+
+MAX_SYMREF_DEPTH = 5
+REF_TEMPLATES = (
+    "refs/{}",
+    "refs/tags/{}",
+    "refs/heads/{}",
+    "refs/remotes/{}",
+    "refs/remotes/{}/HEAD",
+)
+REPLACE_REFS_PREFIX = "refs/replace/"
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class PackFile:
+    index: mmap.mmap
+    data: mmap.mmap
+
+    def close(self) -> None:
+        self.index.close()
+        self.data.close()
+
+    def find_offset(self, oid: bytes) -> Union[int, None]:
+        """Find offset of object in pack using fan-out table of pack index."""
+        index = self.index
+        first = oid[0]
+
+        low = (
+            read_uint32(index, IDX_FANOUT_OFFSET + (first - 1) * 4)
+            if first
+            else 0
+        )
+        high = read_uint32(index, IDX_FANOUT_OFFSET + first * 4)
+
+        while low < high:
+            middle = (low + high) // 2
+            name_offset = IDX_NAMES_OFFSET + middle * 20
+            name = index[name_offset : name_offset + 20]
+            if name < oid:
+                low = middle + 1
+            elif name > oid:
+                high = middle
+            else:
+                break
+        else:
+            return None
+
+        count = read_uint32(index, IDX_FANOUT_OFFSET + 255 * 4)
+        offsets_offset = IDX_NAMES_OFFSET + count * 24
+        offset = read_uint32(index, offsets_offset + middle * 4)
+        if offset & IDX_LARGE_OFFSET_FLAG:  # pragma: no cover
+            large_offset = (
+                offsets_offset
+                + count * 4
+                + (offset & ~IDX_LARGE_OFFSET_FLAG) * 8
+            )
+            return int.from_bytes(
+                index[large_offset : large_offset + 8], "big"
+            )
+        return offset
+
+    @classmethod
+    def open(cls, index_path: Path) -> Self:  # noqa: A003
+        with (
+            index_path.open("rb") as index_handler,
+            index_path.with_suffix(".pack").open("rb") as data_handler,
+        ):
+            index = mmap.mmap(
+                index_handler.fileno(), 0, access=mmap.ACCESS_READ
+            )
+            data = mmap.mmap(data_handler.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if index[: len(IDX_V2_HEADER)] != IDX_V2_HEADER:  # pragma: no cover
+            index.close()
+            data.close()
+            raise ObjectStoreError(f"Unsupported pack index: {index_path}")
+
+        return cls(index=index, data=data)
+
+    def read_at(self, offset: int, store: ObjectStore) -> tuple[str, bytes]:
+        data = self.data
+        start = offset
+
+        byte = data[offset]
+        type_num = (byte >> 4) & 7
+        size = byte & 15
+        shift = 4
+        offset += 1
+        while byte & 0x80:
+            byte = data[offset]
+            size |= (byte & 0x7F) << shift
+            shift += 7
+            offset += 1
+
+        if type_num == OBJECT_TYPE_OFS_DELTA:
+            byte = data[offset]
+            distance = byte & 0x7F
+            offset += 1
+            while byte & 0x80:
+                byte = data[offset]
+                distance = ((distance + 1) << 7) | (byte & 0x7F)
+                offset += 1
+
+            base_type, base = self.read_at(start - distance, store)
+            return (
+                base_type,
+                apply_delta(base, self.decompress(offset, size)),
+            )
+
+        if type_num == OBJECT_TYPE_REF_DELTA:
+            base_oid = data[offset : offset + 20].hex()
+            base_type, base = store.read_raw(base_oid)
+            return (
+                base_type,
+                apply_delta(base, self.decompress(offset + 20, size)),
+            )
+
+        maybe_type = OBJECT_TYPES.get(type_num)
+        if maybe_type is None:  # pragma: no cover
+            raise ObjectStoreError(f"Unexpected pack object type: {type_num}")
+        return (maybe_type, self.decompress(offset, size))
+
+    def decompress(self, offset: int, size: int) -> bytes:
+        decompressor = zlib.decompressobj()
+        chunks: list[bytes] = []
+
+        with memoryview(self.data) as view:
+            while not decompressor.eof:
+                chunk = view[offset : offset + CHUNK_SIZE]
+                if not chunk:  # pragma: no cover
+                    raise ObjectStoreError("Unexpected end of pack data")
+                chunks.append(decompressor.decompress(chunk))
+                offset += CHUNK_SIZE
+
+        content = b"".join(chunks)
+        if len(content) != size:  # pragma: no cover
+            raise ObjectStoreError("Unexpected size of pack object")
+        return content
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class ObjectStore:
+    """Read git objects & refs directly from ``.git`` directory.
+
+    Support loose objects, packfiles (v2 pack indexes), loose & packed refs.
+    For anything else (alternates, reftable, SHA-256 repositories, worktrees,
+    replace refs, etc.) either ``from_path`` returns None, or
+    ``ObjectStoreError`` is raised, so caller is able to fallback to git
+    subprocess.
+    """
+
+    git_dir: Path
+
+    packed_refs: dict[str, str] = dataclasses.field(
+        default_factory=dict, repr=False
+    )
+    packs: Union[list[PackFile], None] = dataclasses.field(
+        default=None, init=False, repr=False
+    )
+
+    def close(self) -> None:
+        for pack in self.packs or ():
+            pack.close()
+        self.packs = None
+
+    @classmethod
+    def from_path(cls, path: Path) -> Union[Self, None]:
+        """Open object store of git repository, which contains given path.
+
+        Return None if repository layout is not supported.
+        """
+        if any(os.getenv(item) for item in GIT_ENV_VARS):
+            return None
+
+        git_dir = find_git_dir(path)
+        if git_dir is None or not is_supported(git_dir):
+            return None
+
+        packed_refs = read_packed_refs(git_dir)
+        if any(item.startswith(REPLACE_REFS_PREFIX) for item in packed_refs):
+            return None
+
+        return cls(git_dir=git_dir, packed_refs=packed_refs)
+
+    def list_commits(
+        self, from_ref: str, to_ref: str = "HEAD"
+    ) -> tuple[str, ...]:
+        """List messages of commits reachable from one ref, but not other.
+
+        Same as ``git log --format=%B from_ref..to_ref``: commits are walked
+        and returned newest first, by their committer date.
+        """
+        include = self.resolve_commit(to_ref)
+        exclude = self.resolve_commit(from_ref)
+
+        commit_contents: dict[str, bytes] = {}
+        parents: dict[str, tuple[str, ...]] = {}
+        uninteresting: set[str] = set()
+
+        counter = itertools.count()
+        queue: list[tuple[int, int, str]] = []
+        queued: set[str] = set()
+        # Amount of queued commits, which are not marked as uninteresting
+        interesting_queued = 0
+
+        def add_commit(oid: str) -> None:
+            nonlocal interesting_queued
+
+            content = self.read_commit(oid)
+            commit_parents, timestamp = parse_commit_headers(content)
+            commit_contents[oid] = content
+            parents[oid] = commit_parents
+            heapq.heappush(queue, (-timestamp, next(counter), oid))
+            queued.add(oid)
+            if oid not in uninteresting:
+                interesting_queued += 1
+
+        def mark_uninteresting(oid: str) -> None:
+            nonlocal interesting_queued
+
+            stack = [oid]
+            while stack:
+                item = stack.pop()
+                if item in uninteresting:
+                    continue
+                uninteresting.add(item)
+                if item in queued:
+                    interesting_queued -= 1
+                stack.extend(parents.get(item, ()))
+
+        add_commit(exclude)
+        mark_uninteresting(exclude)
+        if include not in parents:
+            add_commit(include)
+
+        walked: list[str] = []
+        while queue:
+            _, _, oid = heapq.heappop(queue)
+            queued.discard(oid)
+            is_uninteresting = oid in uninteresting
+            if not is_uninteresting:
+                interesting_queued -= 1
+
+            for parent in parents[oid]:
+                if is_uninteresting:
+                    mark_uninteresting(parent)
+                if parent not in parents:
+                    add_commit(parent)
+
+            if is_uninteresting:
+                if not interesting_queued:
+                    break
+                continue
+
+            walked.append(oid)
+
+        return tuple(
+            parse_object_message(commit_contents[oid])
+            for oid in walked
+            if oid not in uninteresting
+        )
+
+    def read_commit(self, oid: str) -> bytes:
+        object_type, content = self.read_raw(oid)
+        if object_type != "commit":
+            raise ObjectStoreError(f"Git object is not a commit: {oid}")
+        return content
+
+    def read_object(self, name: str) -> Union[tuple[str, bytes], None]:
+        """Read type & content of git object by its name.
+
+        Return None if name could not be resolved, similarly to
+        ``git cat-file --batch``.
+        """
+        maybe_oid = self.resolve(name)
+        if maybe_oid is None:
+            return None
+        return self.read_raw(maybe_oid)
+
+    def read_raw(self, oid: str) -> tuple[str, bytes]:
+        loose_path = self.git_dir / "objects" / oid[:2] / oid[2:]
+        try:
+            raw = loose_path.read_bytes()
+        except FileNotFoundError:
+            pass
+        else:
+            header, _, content = zlib.decompress(raw).partition(b"\0")
+            return (header.split(b" ", 1)[0].decode("utf-8"), content)
+
+        oid_bytes = bytes.fromhex(oid)
+        for pack in self._get_packs():
+            maybe_offset = pack.find_offset(oid_bytes)
+            if maybe_offset is not None:
+                return pack.read_at(maybe_offset, self)
+
+        raise ObjectStoreError(f"Git object not found: {oid}")
+
+    def resolve(self, name: str) -> Union[str, None]:
+        """Resolve object name into object ID.
+
+        Support full object IDs, ``HEAD`` and ref names in the same order as
+        git does, but raise ``ObjectStoreError`` for anything more complex
+        than that (abbreviated object IDs, revision expressions, etc).
+        """
+        if HEX_OID_RE.match(name):
+            return name
+
+        if UNSAFE_REF_RE.search(name) or not name:
+            raise ObjectStoreError(f"Unsupported git revision: {name!r}")
+
+        if name == "HEAD" or name.startswith("refs/"):
+            maybe_oid = self.resolve_ref(name)
+            if maybe_oid is not None:
+                return maybe_oid
+
+        for template in REF_TEMPLATES:
+            maybe_oid = self.resolve_ref(template.format(name))
+            if maybe_oid is not None:
+                return maybe_oid
+
+        if ABBREV_OID_RE.match(name):
+            raise ObjectStoreError(f"Unsupported git revision: {name!r}")
+        return None
+
+    def resolve_commit(self, name: str) -> str:
+        """Resolve object name into commit ID, peeling annotated tags."""
+        maybe_oid = self.resolve(name)
+        if maybe_oid is None:
+            raise ObjectStoreError(f"Unknown git revision: {name!r}")
+
+        oid = maybe_oid
+        while True:
+            object_type, content = self.read_raw(oid)
+            if object_type == "commit":
+                return oid
+            if object_type != "tag":
+                raise ObjectStoreError(f"Not a commit: {name!r}")
+            oid = content[7:47].decode("utf-8")
+
+    def resolve_ref(self, ref: str, *, depth: int = 0) -> Union[str, None]:
+        if depth > MAX_SYMREF_DEPTH:
+            raise ObjectStoreError(f"Too deep symbolic ref: {ref!r}")
+
+        ref_path = self.git_dir / ref
+        if ref_path.is_file():
+            value = ref_path.read_text().strip()
+            if value.startswith("ref: "):
+                return self.resolve_ref(value[5:], depth=depth + 1)
+            if HEX_OID_RE.match(value):
+                return value
+            raise ObjectStoreError(f"Unexpected ref content: {ref!r}")
+
+        return self.packed_refs.get(ref)
+
+    def _get_packs(self) -> list[PackFile]:
+        packs = self.packs
+        if packs is None:
+            packs = self.packs = [
+                PackFile.open(item)
+                for item in sorted(
+                    (self.git_dir / "objects" / "pack").glob("*.idx")
+                )
+                if item.with_suffix(".pack").exists()
+            ]
+        return packs
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    offset, base_size = read_varint(delta, 0)
+    offset, result_size = read_varint(delta, offset)
+    if base_size != len(base):  # pragma: no cover
+        raise ObjectStoreError("Delta base size mismatch")
+
+    result = bytearray()
+    delta_size = len(delta)
+    while offset < delta_size:
+        opcode = delta[offset]
+        offset += 1
+
+        # Copy from base object
+        if opcode & 0x80:
+            copy_offset = copy_size = 0
+            for bit in range(4):
+                if opcode & (1 << bit):
+                    copy_offset |= delta[offset] << (bit * 8)
+                    offset += 1
+            for bit in range(3):
+                if opcode & (1 << (4 + bit)):
+                    copy_size |= delta[offset] << (bit * 8)
+                    offset += 1
+            result += base[copy_offset : copy_offset + (copy_size or 0x10000)]
+        # Insert new data from delta itself
+        elif opcode:
+            result += delta[offset : offset + opcode]
+            offset += opcode
+        else:  # pragma: no cover
+            raise ObjectStoreError("Unexpected delta opcode")
+
+    if len(result) != result_size:  # pragma: no cover
+        raise ObjectStoreError("Delta result size mismatch")
+    return bytes(result)
+
+
+def find_git_dir(path: Path) -> Union[Path, None]:
+    """Find ``.git`` directory for given path, same way as git does.
+
+    Return None, if ``.git`` is a file (worktrees, submodules), as common
+    directories are not supported.
+    """
+    path = path.resolve()
+    for item in (path, *path.parents):
+        dot_git = item / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.exists():
+            return None
+    return None
+
+
+def is_supported(git_dir: Path) -> bool:
+    if (
+        (git_dir / "commondir").exists()
+        or (git_dir / "objects" / "info" / "alternates").exists()
+        or (git_dir / "objects" / "info" / "grafts").exists()
+        or (git_dir / "reftable").exists()
+        or (git_dir / "refs" / "replace").exists()
+    ):
+        return False
+
+    config_path = git_dir / "config"
+    if config_path.exists():
+        return (
+            UNSUPPORTED_EXTENSIONS_RE.search(config_path.read_text()) is None
+        )
+    return True
+
+
+def parse_commit_headers(content: bytes) -> tuple[tuple[str, ...], int]:
+    """Parse parents & committer timestamp from commit object headers."""
+    headers, _, _ = content.partition(b"\n\n")
+
+    parents: list[str] = []
+    timestamp = 0
+    for line in headers.split(b"\n"):
+        if line.startswith(b"parent "):
+            parents.append(line[7:47].decode("utf-8"))
+        elif line.startswith(b"committer "):
+            timestamp = int(line.rsplit(b" ", 2)[1])
+        elif line.startswith(b"encoding ") and line[9:].lower() not in (
+            b"utf-8",
+            b"utf8",
+        ):
+            raise ObjectStoreError("Unsupported commit encoding")
+
+    return (tuple(parents), timestamp)
+
+
+def parse_object_message(content: bytes) -> str:
+    """Return message of commit or tag object, skipping object headers."""
+    _, _, message = content.partition(b"\n\n")
+    return message.strip().decode("utf-8")
+
+
+def read_packed_refs(git_dir: Path) -> dict[str, str]:
+    packed_refs_path = git_dir / "packed-refs"
+    if not packed_refs_path.exists():
+        return {}
+
+    packed_refs: dict[str, str] = {}
+    for line in packed_refs_path.read_text().splitlines():
+        if not line or line[0] in "#^":
+            continue
+        oid, _, ref = line.partition(" ")
+        packed_refs[ref] = oid
+    return packed_refs
+
+
+def read_uint32(data: mmap.mmap, offset: int) -> int:
+    return int.from_bytes(data[offset : offset + 4], "big")
+
+
+def read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        offset += 1
+        if not byte & 0x80:
+            return (offset, value)
@@ -1,12 +1,22 @@
 import re
+from functools import lru_cache
 
+REGEXP_CACHE_SIZE = 256
+
+GLOB_SPECIAL_RE = re.compile(r"([\*\?\[])")
 VAR_RE = re.compile(r"\{(?P<var>[^\{]+)\}")
 
 
+def to_glob(value: str) -> str:
+    """Convert format string, such as tag format, to glob pattern."""
+    return VAR_RE.sub("*", GLOB_SPECIAL_RE.sub(r"[\1]", value))
+
+
 def ensure_regexp_dots(value: str) -> str:
     return value.replace(".", r"\.")
 
 
+@lru_cache(maxsize=REGEXP_CACHE_SIZE)
 def to_regexp(value: str) -> re.Pattern[str]:
     value = ensure_regexp_dots(value)
     for item in VAR_RE.findall(value):
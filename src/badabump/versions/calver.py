@@ -1,20 +1,21 @@
 from __future__ import annotations
 
 import dataclasses
+from functools import total_ordering
 from typing import TYPE_CHECKING, Union
 
 from badabump.constants import DEFAULT_VERSION_SCHEMA
 from badabump.datetimes import utcnow_naive
 from badabump.versions.exceptions import VersionError, VersionParseError
-from badabump.versions.formatting import format_version
-from badabump.versions.parsing import parse_version
+from badabump.versions.formatting import bind_version_formatter
+from badabump.versions.parsing import bind_schema_matcher
 
 if TYPE_CHECKING:
     import datetime
 
     from typing_extensions import Self
 
-    from badabump.annotations import DictStrAny, DictStrStr
+    from badabump.annotations import DictStrStr
     from badabump.configs import UpdateConfig
 
 
@@ -50,7 +51,11 @@ SCHEMA_PARTS_PARSING = {
     "MICRO": r"(?P<micro>\d+)",
 }
 
+get_schema_matcher = bind_schema_matcher(SCHEMA_PARTS_PARSING)
+get_version_formatter = bind_version_formatter(SCHEMA_PARTS_FORMATTING)
 
+
+@total_ordering
 @dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
 class CalVer:
     year: int
@@ -62,11 +67,38 @@ class CalVer:
 
     schema: str = DEFAULT_VERSION_SCHEMA
 
-    def format(self) -> str:  # noqa: A003
-        return format_version(
-            self.schema, SCHEMA_PARTS_FORMATTING, self.get_format_context()
+    sort_key: tuple[int, ...] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Missing parts are sorted before any present value
+        object.__setattr__(
+            self,
+            "sort_key",
+            tuple(
+                item if item is not None else -1
+                for item in (
+                    self.year,
+                    self.month,
+                    self.week,
+                    self.day,
+                    self.minor,
+                    self.micro,
+                )
+            ),
         )
 
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, CalVer):
+            return NotImplemented
+        # Versions with same sort key, but different schemas are not equal,
+        # so order them by schema as well
+        return (self.sort_key, self.schema) < (other.sort_key, other.schema)
+
+    def format(self) -> str:  # noqa: A003
+        return get_version_formatter(self.schema).format(self)
+
     @classmethod
     def from_parsed_dict(cls, parsed: DictStrStr, *, schema: str) -> Self:
         maybe_year = guess_year(parsed.get("year"), parsed.get("short_year"))
@@ -84,8 +116,10 @@ class CalVer:
         )
 
     @classmethod
-    def initial(cls, *, schema: str) -> Self:
-        utcnow = utcnow_naive()
+    def initial(
+        cls, *, schema: str, now: Union[datetime.datetime, None] = None
+    ) -> Self:
+        utcnow = now or utcnow_naive()
         return cls(
             year=utcnow.year,
             month=utcnow.month,
@@ -98,16 +132,18 @@ class CalVer:
 
     @classmethod
     def parse(cls, value: str, *, schema: str) -> Self:
-        maybe_parsed = parse_version(schema, SCHEMA_PARTS_PARSING, value)
+        maybe_parsed = get_schema_matcher(schema).match(value)
         if maybe_parsed:
             return cls.from_parsed_dict(maybe_parsed, schema=schema)
         raise VersionParseError(schema, value)
 
-    def get_format_context(self) -> DictStrAny:
-        return {**dataclasses.asdict(self), "short_year": self.short_year}
-
-    def update(self, config: UpdateConfig) -> Self:
-        utcnow = utcnow_naive()
+    def update(
+        self,
+        config: UpdateConfig,
+        *,
+        now: Union[datetime.datetime, None] = None,
+    ) -> Self:
+        utcnow = now or utcnow_naive()
 
         next_minor: Union[int, None] = None
         next_micro: Union[int, None] = None
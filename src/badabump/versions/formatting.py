@@ -1,12 +1,79 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import dataclasses
+from functools import lru_cache
+from string import Formatter
+from typing import TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
-    from badabump.annotations import DictStrAny, DictStrStr
+    from collections.abc import Callable, Mapping
 
+    from badabump.annotations import DictStrStr
 
-def format_version(schema: str, parts: DictStrStr, context: DictStrAny) -> str:
-    for part, template in parts.items():
-        schema = schema.replace(part, template)
-    return schema.format(**context)
+FORMATTER_CACHE_SIZE = 256
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class VersionFormatter:
+    """Version schema, compiled into literal & field segments.
+
+    Each segment is ``(literal, field name, format spec)`` tuple, where field
+    name is None for trailing literal. Field values are read from attributes
+    of formatted object, or from mapping via ``format_map``.
+    """
+
+    schema: str
+    segments: tuple[tuple[str, Union[str, None], str], ...]
+
+    def format(self, value: object) -> str:  # noqa: A003
+        return "".join(
+            (
+                f"{literal}{format(getattr(value, field), spec)}"
+                if field is not None
+                else literal
+            )
+            for literal, field, spec in self.segments
+        )
+
+    def format_map(self, values: Mapping[str, object]) -> str:
+        """Format version, reading field values from mapping instead."""
+        return "".join(
+            (
+                f"{literal}{format(values[field], spec)}"
+                if field is not None
+                else literal
+            )
+            for literal, field, spec in self.segments
+        )
+
+
+def bind_version_formatter(
+    parts: DictStrStr,
+) -> Callable[[str], VersionFormatter]:
+    """Bind formatting parts to function, which gets formatter for schema.
+
+    Each module binds its own parts once, so formatters are cached by schema
+    string only and can be reused for formatting any number of versions.
+    """
+
+    @lru_cache(maxsize=FORMATTER_CACHE_SIZE)
+    def get_version_formatter(schema: str) -> VersionFormatter:
+        return compile_version_formatter(schema, parts)
+
+    return get_version_formatter
+
+
+def compile_version_formatter(
+    schema: str, parts: DictStrStr
+) -> VersionFormatter:
+    template = schema
+    for part, field in parts.items():
+        template = template.replace(part, field)
+
+    return VersionFormatter(
+        schema=schema,
+        segments=tuple(
+            (literal, field or None, spec or "")
+            for literal, field, spec, _ in Formatter().parse(template)
+        ),
+    )
@@ -1,19 +1,57 @@
 from __future__ import annotations
 
+import dataclasses
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, Union
 
-from badabump.regexps import ensure_regexp_dots
+from badabump.regexps import ensure_regexp_dots, REGEXP_CACHE_SIZE
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from badabump.annotations import DictStrStr
 
 
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class SchemaMatcher:
+    """Compiled regexp to match version strings against given schema."""
+
+    schema: str
+    pattern: re.Pattern[str]
+
+    def match(self, value: str) -> Union[DictStrStr, None]:
+        maybe_matched = self.pattern.match(value)
+        if maybe_matched:
+            return maybe_matched.groupdict()
+        return None
+
+
+def bind_schema_matcher(parts: DictStrStr) -> Callable[[str], SchemaMatcher]:
+    """Bind schema parts to function, which gets compiled matcher for schema.
+
+    Each module binds its own parts once, so matchers are cached by schema
+    string only and can be reused for matching any number of values.
+    """
+
+    @lru_cache(maxsize=REGEXP_CACHE_SIZE)
+    def get_schema_matcher(schema: str) -> SchemaMatcher:
+        return SchemaMatcher(
+            schema=schema, pattern=build_schema_regexp(schema, parts)
+        )
+
+    return get_schema_matcher
+
+
 def build_schema_regexp(schema: str, parts: DictStrStr) -> re.Pattern[str]:
-    schema = ensure_regexp_dots(schema)
+    return re.compile(rf"^{schema_to_regexp(schema, parts)}$")
+
+
+def schema_to_regexp(schema: str, parts: DictStrStr) -> str:
+    value = ensure_regexp_dots(schema)
     for part, regexp in parts.items():
-        schema = schema.replace(part, regexp)
-    return re.compile(rf"^{schema}$")
+        value = value.replace(part, regexp)
+    return value
 
 
 def parse_version(
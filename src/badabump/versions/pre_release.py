@@ -4,16 +4,17 @@ import dataclasses
 from collections import defaultdict
 from contextlib import suppress
 from enum import Enum, unique
+from functools import total_ordering
 from typing import TYPE_CHECKING, Union
 
 from badabump.enums import ProjectTypeEnum
-from badabump.versions.formatting import format_version
-from badabump.versions.parsing import parse_version
+from badabump.versions.formatting import bind_version_formatter
+from badabump.versions.parsing import bind_schema_matcher
 
 if TYPE_CHECKING:
     from typing_extensions import Self
 
-    from badabump.annotations import DictStrAny, DictStrStr
+    from badabump.annotations import DictStrStr
     from badabump.configs import UpdateConfig
 
 
@@ -31,6 +32,9 @@ SCHEMA_PARTS_PARSING = {
     "NUMBER": r"(?P<number>\d+)",
 }
 
+get_schema_matcher = bind_schema_matcher(SCHEMA_PARTS_PARSING)
+get_version_formatter = bind_version_formatter(SCHEMA_PARTS_FORMATTING)
+
 
 @unique
 class PreReleaseTypeEnum(Enum):
@@ -45,6 +49,10 @@ NEXT_PRE_RELEASE_TYPE = {
     PreReleaseTypeEnum.rc: PreReleaseTypeEnum.rc,
 }
 
+PRE_RELEASE_TYPE_ORDER = {
+    item: idx for idx, item in enumerate(PreReleaseTypeEnum)
+}
+
 PRE_RELEASE_TYPE_MAPPING = {
     ProjectTypeEnum.python: {
         PreReleaseTypeEnum.alpha: "a",
@@ -54,11 +62,28 @@ PRE_RELEASE_TYPE_MAPPING = {
 }
 
 
+@total_ordering
 @dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
 class PreRelease:
     pre_release_type: PreReleaseTypeEnum = PreReleaseTypeEnum.alpha
     number: int = 0
 
+    sort_key: tuple[int, ...] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "sort_key",
+            (PRE_RELEASE_TYPE_ORDER[self.pre_release_type], self.number),
+        )
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, PreRelease):
+            return NotImplemented
+        return self.sort_key < other.sort_key
+
     @classmethod
     def from_parsed_dict(
         cls, parsed_dict: DictStrStr, *, project_type: ProjectTypeEnum
@@ -74,7 +99,7 @@ class PreRelease:
     def parse(cls, value: str, *, project_type: ProjectTypeEnum) -> Self:
         schema = SCHEMA_MAPPING[project_type]
 
-        maybe_parsed = parse_version(schema, SCHEMA_PARTS_PARSING, value)
+        maybe_parsed = get_schema_matcher(schema).match(value)
         if maybe_parsed:
             with suppress(KeyError):
                 return cls.from_parsed_dict(
@@ -87,16 +112,16 @@ class PreRelease:
         )
 
     def format(self, *, project_type: ProjectTypeEnum) -> str:  # noqa: A003
-        schema = SCHEMA_MAPPING[project_type]
-
-        context: DictStrAny = {"number": self.number}
         maybe_type_mapping = PRE_RELEASE_TYPE_MAPPING.get(project_type)
-        if maybe_type_mapping:
-            context["type"] = maybe_type_mapping[self.pre_release_type]
-        else:
-            context["type"] = self.pre_release_type.value
+        pre_release_type = (
+            maybe_type_mapping[self.pre_release_type]
+            if maybe_type_mapping
+            else self.pre_release_type.value
+        )
 
-        return format_version(schema, SCHEMA_PARTS_FORMATTING, context)
+        return get_version_formatter(SCHEMA_MAPPING[project_type]).format_map(
+            {"type": pre_release_type, "number": self.number}
+        )
 
     def update(self, config: UpdateConfig) -> Union[Self, None]:
         if config.is_pre_release is False:
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import dataclasses
+from functools import total_ordering
 from typing import TYPE_CHECKING, Union
 
 from badabump.constants import DEFAULT_SEMVER_SCHEMA as SCHEMA
 from badabump.versions.exceptions import VersionParseError
-from badabump.versions.formatting import format_version
-from badabump.versions.parsing import parse_version
+from badabump.versions.formatting import bind_version_formatter
+from badabump.versions.parsing import bind_schema_matcher
 
 if TYPE_CHECKING:
+    import datetime
+
     from typing_extensions import Self
 
     from badabump.annotations import DictStrStr
@@ -26,7 +29,11 @@ SCHEMA_PARTS_PARSING = {
     "PATCH": r"(?P<patch>\d+)",
 }
 
+get_schema_matcher = bind_schema_matcher(SCHEMA_PARTS_PARSING)
+get_version_formatter = bind_version_formatter(SCHEMA_PARTS_FORMATTING)
+
 
+@total_ordering
 @dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
 class SemVer:
     major: int
@@ -35,6 +42,22 @@ class SemVer:
 
     schema: str = SCHEMA
 
+    sort_key: tuple[int, ...] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "sort_key", (self.major, self.minor, self.patch)
+        )
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, SemVer):
+            return NotImplemented
+        # Versions with same sort key, but different schemas are not equal,
+        # so order them by schema as well
+        return (self.sort_key, self.schema) < (other.sort_key, other.schema)
+
     @classmethod
     def from_parsed_dict(
         cls, parsed: DictStrStr, *, schema: Union[str, None] = None
@@ -52,17 +75,25 @@ class SemVer:
 
     @classmethod
     def parse(cls, value: str, *, schema: Union[str, None] = None) -> Self:
-        maybe_parsed = parse_version(SCHEMA, SCHEMA_PARTS_PARSING, value)
+        maybe_parsed = get_schema_matcher(SCHEMA).match(value)
         if maybe_parsed:
             return cls.from_parsed_dict(maybe_parsed, schema=schema)
         raise VersionParseError(schema or SCHEMA, value)
 
     def format(self) -> str:  # noqa: A003
-        return format_version(
-            self.schema, SCHEMA_PARTS_FORMATTING, dataclasses.asdict(self)
-        )
+        return get_version_formatter(self.schema).format(self)
+
+    def update(
+        self,
+        config: UpdateConfig,
+        *,
+        now: Union[datetime.datetime, None] = None,
+    ) -> Self:
+        """Update version using given update config.
 
-    def update(self, config: UpdateConfig) -> Self:
+        SemVer does not depend on current date, so ``now`` is ignored and
+        accepted only to share same signature with CalVer.
+        """
         if config.is_pre_release:
             return self
 
@@ -1,34 +1,65 @@
 from __future__ import annotations
 
 import dataclasses
-import json
+import re
 from contextlib import suppress
+from functools import lru_cache, total_ordering
 from typing import cast, TYPE_CHECKING, TypeAlias, Union
 
 from badabump.enums import ProjectTypeEnum, VersionTypeEnum
-from badabump.loaders import get_pyproject_toml_metadata, loads_toml
-from badabump.regexps import to_regexp
+from badabump.loaders import (
+    get_pyproject_toml_metadata,
+    load_json_file,
+    load_toml_file,
+)
+from badabump.regexps import REGEXP_CACHE_SIZE, to_regexp
 from badabump.versions import calver, pre_release, semver
 from badabump.versions.calver import CalVer
 from badabump.versions.exceptions import VersionError, VersionParseError
-from badabump.versions.parsing import parse_version
+from badabump.versions.parsing import schema_to_regexp, SchemaMatcher
 from badabump.versions.pre_release import PreRelease
 from badabump.versions.semver import SemVer
 
 if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Iterable
+
     from typing_extensions import Self
 
-    from badabump.annotations import DictStrStr
     from badabump.configs import ProjectConfig, UpdateConfig
 
     CalOrSemVer: TypeAlias = Union[CalVer, SemVer]
 
 
+@total_ordering
 @dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
 class Version:
     version: CalOrSemVer
     pre_release: Union[PreRelease, None] = None
 
+    sort_key: tuple[int, ...] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Release is sorted after all pre-releases of same version
+        pre_release_key = (
+            (0, *self.pre_release.sort_key) if self.pre_release else (1,)
+        )
+        object.__setattr__(
+            self, "sort_key", (*self.version.sort_key, *pre_release_key)
+        )
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        # Versions with same sort key, but different schemas are not equal,
+        # so order them by schema as well
+        return (self.sort_key, self.version.schema) < (
+            other.sort_key,
+            other.version.schema,
+        )
+
     @classmethod
     def from_tag(cls, value: str, *, config: ProjectConfig) -> Self:
         return cls.parse(
@@ -38,7 +69,11 @@ class Version:
 
     @classmethod
     def guess_initial_version(
-        cls, *, config: ProjectConfig, is_pre_release: bool
+        cls,
+        *,
+        config: ProjectConfig,
+        is_pre_release: bool,
+        now: Union[datetime.datetime, None] = None,
     ) -> Self:
         maybe_version_str = find_project_version(config)
         if maybe_version_str:
@@ -51,42 +86,15 @@ class Version:
                 is_pre_release
             )
         return cls(
-            version=CalVer.initial(schema=config.version_schema)
+            version=CalVer.initial(schema=config.version_schema, now=now)
         ).enforce_pre_release(is_pre_release)
 
     @classmethod
     def parse(cls, value: str, *, config: ProjectConfig) -> Self:
-        schema = config.version_schema
-
-        version_cls: type[CalOrSemVer]
-        full_schema_parts: DictStrStr
-        if config.version_type == VersionTypeEnum.semver:
-            version_cls = semver.SemVer
-            full_schema_parts = semver.SCHEMA_PARTS_PARSING
-        else:
-            version_cls = calver.CalVer
-            full_schema_parts = calver.SCHEMA_PARTS_PARSING
-
-        with suppress(VersionError):
-            return cls(version=version_cls.parse(value, schema=schema))
-
-        full_schema = (
-            f"{schema}{pre_release.SCHEMA_MAPPING[config.project_type]}"
-        )
-        full_schema_parts.update(pre_release.SCHEMA_PARTS_PARSING)
-
-        maybe_parsed = parse_version(full_schema, full_schema_parts, value)
-        if maybe_parsed:
-            return cls(
-                version=version_cls.from_parsed_dict(
-                    maybe_parsed, schema=schema
-                ),
-                pre_release=pre_release.PreRelease.from_parsed_dict(
-                    maybe_parsed, project_type=config.project_type
-                ),
-            )
-
-        raise VersionParseError(schema, value)
+        version, maybe_pre_release = get_version_parser(
+            config.version_type, config.version_schema, config.project_type
+        ).parse(value)
+        return cls(version=version, pre_release=maybe_pre_release)
 
     def enforce_pre_release(self, is_pre_release: bool) -> Self:
         if self.pre_release is None and is_pre_release:
@@ -101,7 +109,12 @@ class Version:
             )
         return self.version.format()
 
-    def update(self, config: UpdateConfig) -> Self:
+    def update(
+        self,
+        config: UpdateConfig,
+        *,
+        now: Union[datetime.datetime, None] = None,
+    ) -> Self:
         version_class = self.__class__
 
         if self.pre_release:
@@ -113,31 +126,143 @@ class Version:
         if config.is_pre_release:
             return version_class(
                 version=self.version.update(
-                    dataclasses.replace(config, is_pre_release=False)
+                    dataclasses.replace(config, is_pre_release=False), now=now
                 ),
                 pre_release=PreRelease(),
             )
 
-        return version_class(version=self.version.update(config))
+        return version_class(version=self.version.update(config, now=now))
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class VersionParser:
+    """Parse plain & pre-release versions of given type & schema.
+
+    Both plain & pre-release versions are matched by single regexp, with
+    optional pre-release part. Parser is immutable, so it is safe to share it
+    between threads.
+    """
+
+    version_type: VersionTypeEnum
+    schema: str
+    project_type: ProjectTypeEnum
+    matcher: SchemaMatcher
+
+    def parse(self, value: str) -> tuple[CalOrSemVer, Union[PreRelease, None]]:
+        version_cls: type[CalOrSemVer] = (
+            SemVer if self.version_type == VersionTypeEnum.semver else CalVer
+        )
+
+        maybe_parsed = self.matcher.match(value)
+        if maybe_parsed is None:
+            raise VersionParseError(self.schema, value)
+
+        if maybe_parsed["number"] is None:
+            with suppress(VersionError):
+                return (
+                    version_cls.from_parsed_dict(
+                        maybe_parsed, schema=self.schema
+                    ),
+                    None,
+                )
+            raise VersionParseError(self.schema, value)
+
+        return (
+            version_cls.from_parsed_dict(maybe_parsed, schema=self.schema),
+            PreRelease.from_parsed_dict(
+                maybe_parsed, project_type=self.project_type
+            ),
+        )
 
 
 def find_project_version(config: ProjectConfig) -> Union[str, None]:
     if config.project_type == ProjectTypeEnum.javascript:
-        package_json_path = config.path / "package.json"
-        if package_json_path.exists():
-            with suppress(KeyError, ValueError):
-                return cast(
-                    "str", json.loads(package_json_path.read_text())["version"]
-                )
+        with suppress(KeyError, ValueError):
+            package_json = load_json_file(config.path / "package.json")
+            if package_json is not None:
+                return cast("str", package_json["version"])
     else:
-        pyproject_toml_path = config.path / "pyproject.toml"
-        if pyproject_toml_path.exists():
-            pyproject_toml = loads_toml(pyproject_toml_path.read_text())
+        pyproject_toml = load_toml_file(config.path / "pyproject.toml")
+        if pyproject_toml is not None:
             return get_pyproject_toml_metadata(pyproject_toml, "version")
 
     return None
 
 
+@lru_cache(maxsize=REGEXP_CACHE_SIZE)
+def get_version_parser(
+    version_type: VersionTypeEnum, schema: str, project_type: ProjectTypeEnum
+) -> VersionParser:
+    parts = (
+        semver.SCHEMA_PARTS_PARSING
+        if version_type == VersionTypeEnum.semver
+        else calver.SCHEMA_PARTS_PARSING
+    )
+    version_regexp = schema_to_regexp(schema, parts)
+    pre_release_regexp = schema_to_regexp(
+        pre_release.SCHEMA_MAPPING[project_type],
+        pre_release.SCHEMA_PARTS_PARSING,
+    )
+    return VersionParser(
+        version_type=version_type,
+        schema=schema,
+        project_type=project_type,
+        matcher=SchemaMatcher(
+            schema=f"{schema}{pre_release.SCHEMA_MAPPING[project_type]}",
+            pattern=re.compile(
+                rf"^{version_regexp}(?:{pre_release_regexp})?$"
+            ),
+        ),
+    )
+
+
+def parse_tags(
+    tags: Iterable[str], config: ProjectConfig
+) -> list[tuple[str, Version]]:
+    """Parse all tags, which match tag format, into versions.
+
+    Tags, which do not match tag format or contain invalid version, are
+    skipped. Return tags with their versions, sorted from lowest to highest
+    version.
+    """
+    tag_re = to_regexp(config.tag_format)
+    parser = get_version_parser(
+        config.version_type, config.version_schema, config.project_type
+    )
+
+    parsed: list[tuple[str, Version]] = []
+    for tag in tags:
+        maybe_matched = tag_re.match(tag)
+        if maybe_matched is None:
+            continue
+
+        with suppress(KeyError, ValueError, VersionError):
+            version, maybe_pre_release = parser.parse(
+                maybe_matched.group("version")
+            )
+            parsed.append(
+                (tag, Version(version=version, pre_release=maybe_pre_release))
+            )
+
+    return sorted(parsed, key=lambda item: item[1].sort_key)
+
+
+def simulate_updates(
+    version: Version,
+    steps: Iterable[tuple[datetime.datetime, UpdateConfig]],
+) -> tuple[Version, ...]:
+    """Simulate series of version updates at given dates.
+
+    Each step updates version, resulted from previous step, so it is possible
+    to plan sequence of releases without running the CLI for each of them.
+    """
+    versions: list[Version] = []
+    for now, config in steps:
+        version = version.update(config, now=now)
+        versions.append(version)
+    return tuple(versions)
+
+
 def guess_version_from_tag(value: str, *, tag_format: str) -> str:
     matched = to_regexp(tag_format).match(value)
     if matched:
@@ -10,6 +10,25 @@ CommitTuple: TypeAlias = tuple[str, Union[str, None], str]
 TagTuple: TypeAlias = tuple[str, str]
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run slow benchmarks as well.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="Pass --run-benchmarks to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 @pytest.fixture(scope="function", autouse=True)
 def setup_github_output_env_var(monkeypatch, github_output_path):
     monkeypatch.setenv("GITHUB_OUTPUT", str(github_output_path))
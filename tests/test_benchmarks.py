@@ -0,0 +1,145 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from badabump import changelog
+from badabump.changelog import (
+    ConventionalCommit,
+    parse_commit_type,
+    parse_many,
+)
+
+# Cumulative import time budget of CLI entry points, in microseconds
+IMPORT_TIME_BUDGETS = {
+    "badabump.cli.app": 30_000,
+    "badabump.cli.ci_app": 30_000,
+}
+# Modules, which CLI entry points import only after parsing arguments
+LAZY_MODULES = frozenset(
+    (
+        "badabump.changelog",
+        "badabump.configs",
+        "badabump.git",
+        "badabump.versions",
+        "concurrent.futures.process",
+        "difflib",
+        "json",
+        "multiprocessing",
+        "tempfile",
+        "tomllib",
+    )
+)
+
+
+def measure_import_time(module: str) -> tuple[int, frozenset[str]]:
+    """Import module in fresh interpreter with ``-X importtime``.
+
+    Return cumulative import time of the module & names of all modules
+    imported along with it.
+    """
+    # Do not measure coverage in the subprocess
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith(("COV_CORE_", "COVERAGE_"))
+    }
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    ).stderr
+
+    # Each line is "import time: <self> | <cumulative> | <indent><name>",
+    # where nested imports are indented & listed before their parent
+    items = [
+        (int(cumulative), len(name) - len(name.lstrip()), name.strip())
+        for _, cumulative, name in (
+            line.split("|") for line in stderr.splitlines()[1:]
+        )
+    ]
+    idx = next(idx for idx, (_, _, name) in enumerate(items) if name == module)
+    cumulative_time, depth, _ = items[idx]
+
+    names = {module}
+    for _, item_depth, name in reversed(items[:idx]):
+        if item_depth <= depth:
+            break
+        names.add(name)
+
+    return (cumulative_time, frozenset(names))
+
+
+def test_conventional_commit_fields_access(monkeypatch):
+    parse_commit_type.cache_clear()
+    commits = [
+        ConventionalCommit.from_git_commit(
+            f"feat(scope-{idx % 100})!: Feature #{idx}\n\nIssue: DEV-{idx}"
+        )
+        for idx in range(10_000)
+    ]
+    cache_info = parse_commit_type.cache_info()
+    assert cache_info.misses == 100
+
+    # Accessing fields must not parse commit type or body again
+    monkeypatch.setattr(changelog, "ISSUE_RE", None)
+    for _ in range(10):
+        fields = [
+            (
+                item.commit_type,
+                item.clean_commit_type,
+                item.scope,
+                item.is_breaking_change,
+                item.issues,
+            )
+            for item in commits
+        ]
+    assert parse_commit_type.cache_info() == cache_info
+
+    assert fields[-1] == (
+        "feat",
+        "feat(scope-99)",
+        "scope-99",
+        True,
+        ("DEV-9999",),
+    )
+
+
+@pytest.mark.benchmark
+def test_parse_many_throughput(record_property):
+    commit_types = ("feat", "fix", "chore(deps)", "refactor!", "docs(api)!")
+    corpus = [
+        f"{commit_types[idx % 5]}: Subject #{idx}" for idx in range(1_000_000)
+    ]
+
+    started_at = time.perf_counter()
+    commits = parse_many(corpus)
+    record_property(
+        "subjects_per_second",
+        round(len(corpus) / (time.perf_counter() - started_at)),
+    )
+
+    assert len(commits) == 1_000_000
+    assert commits[-1] == ConventionalCommit(
+        raw_commit_type="docs(api)!", description="Subject #999999"
+    )
+    assert commits[-1].scope == "api"
+    assert commits[-1].is_breaking_change is True
+
+
+@pytest.mark.parametrize("module", tuple(IMPORT_TIME_BUDGETS))
+def test_entry_point_imports(module):
+    _, names = measure_import_time(module)
+    assert names & LAZY_MODULES == set()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("module", tuple(IMPORT_TIME_BUDGETS))
+def test_import_time(module, record_property):
+    import_time, _ = min(measure_import_time(module) for _ in range(3))
+    record_property("import_time_us", import_time)
+    assert import_time < IMPORT_TIME_BUDGETS[module]
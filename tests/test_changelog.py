@@ -1,9 +1,22 @@
+import copy
+import datetime
+import io
+import pickle
+import random
+
 import pytest
 
 from badabump.changelog import (
     ChangeLog,
     COMMIT_TYPE_FEATURE,
     ConventionalCommit,
+    FORMATTED_COMMIT_PR_NUMBERS_RE,
+    FORMATTED_COMMIT_WITH_PR_RE,
+    parse_chunk,
+    parse_chunk_in_worker,
+    parse_commit_type,
+    parse_many,
+    prepare_formatted_commits,
     version_header,
 )
 from badabump.datetimes import utcnow_naive
@@ -219,6 +232,13 @@ def test_changelog_ignore_footer_urls(ignore_footer_urls, expected):
 - {expected}Update logic behind math operations"""
 
 
+def test_changelog_from_chronological_git_commits():
+    changelog = ChangeLog.from_chronological_git_commits(
+        item for item in reversed(DEFAULT_GIT_COMMITS)
+    )
+    assert changelog == ChangeLog.from_git_commits(tuple(DEFAULT_GIT_COMMITS))
+
+
 def test_changelog_invalid_commit():
     with pytest.raises(ValueError):
         ChangeLog.from_git_commits([INVALID_COMMIT])
@@ -251,6 +271,280 @@ def test_changelog_merge_similar_commits():
 - Does not matter (#9999)"""
 
 
+@pytest.mark.parametrize(
+    "git_commit, expected",
+    (
+        ("feat: Feature", ("feat", "feat", None, False, "Feature")),
+        ("feat!: Feature", ("feat", "feat", None, True, "Feature")),
+        (
+            "fix(auth)!:  Fix: login ",
+            ("fix", "fix(auth)", "auth", True, "Fix: login"),
+        ),
+        (
+            "fix(a)(b): Fix",
+            ("fix(a)(b)", "fix(a)(b)", None, False, "Fix"),
+        ),
+        (
+            "fix(auth: Fix): Fix",
+            ("fix(auth", "fix(auth", None, False, "Fix): Fix"),
+        ),
+    ),
+)
+def test_parse_many(git_commit, expected):
+    (commit,) = parse_many([git_commit])
+    assert (
+        commit.commit_type,
+        commit.clean_commit_type,
+        commit.scope,
+        commit.is_breaking_change,
+        commit.description,
+    ) == expected
+
+
+@pytest.mark.parametrize("parallel", (None, False, True))
+def test_parse_many_parallel(monkeypatch, parallel):
+    monkeypatch.setattr("badabump.changelog.PARSE_CHUNK_SIZE", 3)
+    monkeypatch.setattr("badabump.changelog.PARSE_PARALLEL_THRESHOLD", 5)
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+
+    git_commits = DEFAULT_GIT_COMMITS * 2
+    commits = parse_many(iter(git_commits), parallel=parallel)
+    assert commits == tuple(
+        ConventionalCommit.from_git_commit(item) for item in git_commits
+    )
+    assert [item.issues for item in commits[:2]] == [("DEV-55",), ()]
+    assert (
+        parse_many(DEFAULT_GIT_COMMITS[:4], parallel=parallel) == commits[:4]
+    )
+
+
+def test_parse_many_parallel_invalid_commit(caplog, monkeypatch):
+    monkeypatch.setattr("badabump.changelog.PARSE_CHUNK_SIZE", 2)
+
+    git_commits = [*DEFAULT_GIT_COMMITS, INVALID_COMMIT]
+    with pytest.raises(ValueError):
+        parse_many(git_commits, parallel=True)
+
+    caplog.clear()
+    commits = parse_many(git_commits, strict=False, parallel=True)
+    assert commits[-1].commit_type == "unknown"
+    assert [record.subject for record in caplog.records] == [INVALID_COMMIT]
+
+
+def test_parse_chunk_in_worker(caplog):
+    git_commits = [FEATURE_COMMIT, INVALID_COMMIT]
+    commits, records = parse_chunk_in_worker(git_commits, strict=False)
+    assert caplog.records == []
+    assert [record.subject for record in records] == [INVALID_COMMIT]
+    assert commits == parse_chunk(git_commits, strict=False)
+
+    with pytest.raises(ValueError):
+        parse_chunk_in_worker(git_commits)
+
+
+def test_conventional_commit_pickle():
+    commit = ConventionalCommit.from_git_commit(FEATURE_COMMIT)
+    restored = pickle.loads(pickle.dumps(commit))
+    assert restored == commit
+    assert restored.issues == ("DEV-55",)
+    assert copy.copy(commit).commit_type == COMMIT_TYPE_FEATURE
+
+
+@pytest.mark.parametrize(
+    "raw_commit_type, expected",
+    (
+        ("feat", ("feat", "feat", None, False)),
+        ("feat!", ("feat", "feat", None, True)),
+        ("feat(auth)", ("feat", "feat(auth)", "auth", False)),
+        ("feat(auth)!", ("feat", "feat(auth)", "auth", True)),
+        ("feat(auth)!!", ("feat(auth)!", "feat(auth)!", None, True)),
+        ("feat(auth", ("feat(auth", "feat(auth", None, False)),
+        ("!", ("", "", None, True)),
+        ("!!", ("!", "!", None, True)),
+        ("", ("", "", None, False)),
+    ),
+)
+def test_parse_commit_type(raw_commit_type, expected):
+    assert parse_commit_type(raw_commit_type) == expected
+
+
+def test_changelog_format_many(monkeypatch):
+    changelog = ChangeLog.from_git_commits(tuple(DEFAULT_GIT_COMMITS))
+
+    format_commit = ConventionalCommit.format
+    calls = []
+
+    def format_commit_spy(commit, *args, **kwargs):
+        calls.append(commit)
+        return format_commit(commit, *args, **kwargs)
+
+    monkeypatch.setattr(ConventionalCommit, "format", format_commit_spy)
+
+    targets = (
+        (ChangeLogTypeEnum.git_commit, FormatTypeEnum.markdown),
+        (ChangeLogTypeEnum.changelog_file, FormatTypeEnum.markdown),
+        (ChangeLogTypeEnum.git_commit, FormatTypeEnum.rst),
+    )
+    git_changelog, file_changelog, git_rst_changelog = changelog.format_many(
+        targets, is_pre_release=True
+    )
+    assert len(calls) == len(DEFAULT_GIT_COMMITS)
+
+    monkeypatch.setattr(ConventionalCommit, "format", format_commit)
+    assert git_changelog == CHANGELOG_GIT_MD
+    assert file_changelog == CHANGELOG_FILE_MD_PRE
+    assert git_rst_changelog == CHANGELOG_GIT_RST
+    assert changelog.prepare(FormatTypeEnum.markdown) is changelog.prepare(
+        FormatTypeEnum.rst
+    )
+    assert changelog.prepare(
+        FormatTypeEnum.markdown, ignore_footer_urls=False
+    ) is not changelog.prepare(FormatTypeEnum.markdown)
+
+
+@pytest.mark.parametrize(
+    "git_commits, expected",
+    (
+        (
+            ("fix: Fix (#1)", "fix: Fix (#2)", "fix: Fix (#1)"),
+            ("Fix (#1, #2)",),
+        ),
+        (("fix: Fix", "fix: Fix (#1)", "fix: Fix"), ("Fix", "Fix (#1)")),
+        (
+            ("fix: Fix", "fix: Fix (#1)", "fix: Fix (#2)"),
+            ("Fix", "Fix (#1, #2)"),
+        ),
+        (
+            ("fix: Update deps (#1)", "fix: Update dep (#2)"),
+            ("Update deps (#1, #2)",),
+        ),
+        (
+            ("fix: Fix (#1)", "fix: Fix (#2)", "fix: Fix (#1, #2)"),
+            ("Fix (#1, #2)",),
+        ),
+        (
+            ("fix: Fix (#1)", "fix: Fix something (#2)"),
+            ("Fix (#1)", "Fix something (#2)"),
+        ),
+        (
+            ("fix: Fix (#1, #2)", "fix: Fix (#1)", "fix: Fix (#2)"),
+            ("Fix (#1, #2)",),
+        ),
+    ),
+)
+def test_prepare_formatted_commits(git_commits, expected):
+    assert prepare_formatted_commits(
+        (ConventionalCommit.from_git_commit(item) for item in git_commits),
+        FormatTypeEnum.markdown,
+        ignore_footer_urls=True,
+    ) == list(expected)
+
+
+def test_prepare_formatted_commits_many_commits():
+    commits = [
+        ConventionalCommit.from_git_commit(
+            f"chore(deps): Bump package-{idx % 5000} to 1.0.1 (#{idx})"
+        )
+        for idx in range(20_000)
+    ]
+
+    formatted = prepare_formatted_commits(
+        iter(commits), FormatTypeEnum.markdown, ignore_footer_urls=True
+    )
+
+    assert len(formatted) == 5000
+    assert formatted[0] == (
+        "(**deps**) Bump package-0 to 1.0.1 (#0, #5000, #10000, #15000)"
+    )
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_prepare_formatted_commits_same_as_linear_scan(seed):
+    rnd = random.Random(seed)
+    commits = [
+        ConventionalCommit.from_git_commit(
+            "fix: "
+            + rnd.choice(("Fix", "Fix something", "Update dep", "Update deps"))
+            + rnd.choice(("", " (#1)", " (#2)", " (#3)", " (#1, #2)"))
+        )
+        for _ in range(20)
+    ]
+
+    # Merge commits via linear scan over formatted commits with PR numbers
+    expected: list[str] = []
+    seen: set[str] = set()
+    for commit in commits:
+        formatted_commit = commit.format(
+            FormatTypeEnum.markdown, ignore_footer_urls=True
+        )
+        if formatted_commit in seen:
+            continue
+        seen.add(formatted_commit)
+
+        matched = FORMATTED_COMMIT_WITH_PR_RE.match(formatted_commit)
+        other_idx = (
+            next(
+                (
+                    idx
+                    for idx, item in enumerate(expected)
+                    if item.startswith(matched["formatted_commit"])
+                    and FORMATTED_COMMIT_PR_NUMBERS_RE.search(item)
+                ),
+                None,
+            )
+            if matched
+            else None
+        )
+        if other_idx is None:
+            expected.append(formatted_commit)
+            continue
+
+        pr_number = f"#{matched['pr_number']}"
+        pr_numbers = FORMATTED_COMMIT_PR_NUMBERS_RE.search(
+            expected[other_idx]
+        )["pr_numbers"].split(", ")
+        if pr_number not in pr_numbers:
+            expected[other_idx] = f"{expected[other_idx][:-1]}, {pr_number})"
+            seen.add(expected[other_idx])
+
+    assert (
+        prepare_formatted_commits(
+            iter(commits), FormatTypeEnum.markdown, ignore_footer_urls=True
+        )
+        == expected
+    )
+
+
+def test_changelog_sections():
+    changelog = ChangeLog.from_git_commits(tuple(DEFAULT_GIT_COMMITS))
+    assert [
+        (
+            item.label,
+            len(item.breaking_commits),
+            len(item.regular_commits),
+        )
+        for item in changelog.sections
+    ] == [
+        ("Features:", 0, 1),
+        ("Fixes:", 0, 1),
+        ("Refactoring:", 0, 3),
+        ("Other:", 2, 1),
+    ]
+    assert changelog.other_commits == (
+        changelog.sections[-1].breaking_commits[0],
+        changelog.sections[-1].regular_commits[0],
+        changelog.sections[-1].breaking_commits[1],
+    )
+    assert changelog.has_breaking_change is True
+    assert changelog.has_minor_change is True
+    assert changelog.has_micro_change is True
+
+    changelog = ChangeLog.from_git_commits((FIX_COMMIT,))
+    assert [item.label for item in changelog.sections] == ["Fixes:"]
+    assert changelog.has_breaking_change is False
+    assert changelog.has_minor_change is False
+
+
 @pytest.mark.parametrize(
     "fix_commit",
     (
@@ -278,6 +572,18 @@ def test_changelog_strip_spaces(fix_commit):
     assert content == CHANGELOG_GIT_MD
 
 
+@pytest.mark.parametrize("changelog_type", ChangeLogTypeEnum)
+@pytest.mark.parametrize("format_type", FormatTypeEnum)
+@pytest.mark.parametrize("git_commits", ((), tuple(DEFAULT_GIT_COMMITS)))
+def test_changelog_write(changelog_type, format_type, git_commits):
+    changelog = ChangeLog.from_git_commits(git_commits)
+    stream = io.StringIO()
+    changelog.write(stream, changelog_type, format_type, is_pre_release=True)
+    assert stream.getvalue() == changelog.format(
+        changelog_type, format_type, is_pre_release=True
+    )
+
+
 def test_changelog_with_feature_commit():
     changelog = ChangeLog.from_git_commits([FEATURE_COMMIT])
     assert changelog.has_breaking_change is False
@@ -422,3 +728,16 @@ def test_version_header(
         include_date=include_date,
         is_pre_release=is_pre_release,
     )
+
+
+def test_version_header_now():
+    assert (
+        version_header(
+            "1.0.0",
+            FormatTypeEnum.markdown,
+            include_date=True,
+            is_pre_release=False,
+            now=datetime.datetime(2024, 3, 1, 12),
+        )
+        == "# 1.0.0 (2024-03-01)"
+    )
@@ -1,9 +1,13 @@
+import dataclasses
 import io
 
 import pytest
 
+from badabump.changelog import ChangeLog
 from badabump.cli.app import main
-from badabump.enums import ProjectTypeEnum
+from badabump.cli.bump import create_update_config, guess_update_config
+from badabump.enums import GitBackendEnum, ProjectTypeEnum
+from badabump.loaders import FILE_CACHE
 
 BADABUMP_CONFIG_SEMVER_TOML = """[tool.badabump]
 version_type = "semver"
@@ -168,6 +172,85 @@ def test_ci_output(
         assert f'"another-project": "{version}"' in next_content
 
 
+@pytest.mark.parametrize("custom_path", (False, True))
+def test_commit_cache(
+    capsys, tmp_path, create_git_commit, create_git_repository, custom_path
+):
+    git = create_git_repository(
+        (
+            "pyproject.toml",
+            BADABUMP_CONFIG_SEMVER_TOML
+            + PYPROJECT_TOML.format(version="1.0.0"),
+            "feat: Initial commit",
+        ),
+        tag=("v1.0.0", "1.0.0 Release"),
+    )
+    path = git.path
+
+    (path / "file.txt").write_text("")
+    create_git_commit(path, "feat(auth): Implement login flow")
+
+    cache_path = path / ".git" / "badabump" / "commits.cache"
+    args = ["-C", str(path), "--dry-run", "--commit-cache"]
+    if custom_path:
+        cache_path = tmp_path / "cache" / "commits.cache"
+        args.append(str(cache_path))
+
+    assert main(args) == 0
+    expected = capsys.readouterr().out
+    assert "Next version: 1.1.0\n" in expected
+    assert "- (**auth**) Implement login flow" in expected
+    assert len(cache_path.read_text().splitlines()) == 2
+
+    assert main(args) == 0
+    assert capsys.readouterr().out == expected
+
+
+@pytest.mark.parametrize("backend", GitBackendEnum)
+@pytest.mark.parametrize(
+    "commits",
+    (
+        ("fix: Fix", "docs: Docs"),
+        ("fix: Fix", "feat(auth): Login"),
+        ("feat: Feature", "refactor!: Rewrite", "fix: Fix"),
+        ("fix: Fix\n\nBREAKING CHANGE: Config moved", "feat: Feature"),
+        ("docs: Mention BREAKING CHANGE: in docs", "fix: Fix"),
+        ("fix: Fix\n\nMention BREAKING CHANGE:", "feat: Feature"),
+    ),
+)
+@pytest.mark.parametrize("is_pre_release", (False, True))
+def test_guess_update_config(
+    create_git_commit,
+    create_git_repository,
+    backend,
+    commits,
+    is_pre_release,
+):
+    git = create_git_repository(
+        ("README.md", None, "feat: Initial commit"),
+        tag=("v1.0.0", "1.0.0 Release"),
+    )
+    for idx, commit in enumerate(commits):
+        (git.path / "README.md").write_text(f"{idx}")
+        create_git_commit(git.path, commit)
+
+    expected = create_update_config(
+        ChangeLog.from_git_commits(git.list_commits("v1.0.0")),
+        is_pre_release,
+    )
+    with dataclasses.replace(git, backend=backend) as git:
+        assert (
+            guess_update_config(
+                git, "v1.0.0", is_pre_release=is_pre_release, strict=True
+            )
+            == expected
+        )
+        assert (
+            guess_update_config(git, "HEAD", is_pre_release=is_pre_release)
+            is None
+        )
+
+
 @pytest.mark.parametrize(
     "project_type, file_name, template, version, expected",
     (
@@ -306,6 +389,32 @@ def test_minor_change(
     assert "Next version: 1.1.0\n" in captured.out
 
 
+def test_pyproject_toml_parsed_once(
+    monkeypatch, create_git_commit, create_git_repository
+):
+    monkeypatch.setattr("sys.stdin", io.StringIO("y"))
+
+    git = create_git_repository(
+        (
+            "pyproject.toml",
+            BADABUMP_CONFIG_SEMVER_TOML
+            + PYPROJECT_TOML.format(version="1.0.0"),
+            "feat: Initial commit",
+        ),
+        tag=("v1.0.0", "1.0.0 Release"),
+    )
+    path = git.path
+
+    (path / "file.ext").write_text("")
+    create_git_commit(path, "fix: Fix")
+
+    FILE_CACHE.misses = 10
+    assert main(["-C", str(path)]) == 0
+    assert FILE_CACHE.misses == 1
+    assert FILE_CACHE.hits == 1
+    assert 'version = "1.0.1"' in (path / "pyproject.toml").read_text()
+
+
 @pytest.mark.parametrize(
     "pyproject_toml",
     (
@@ -403,3 +512,63 @@ def test_wrong_answer(
     assert "OK! OK! Exit..." in captured.out
 
     assert content == (path / "pyproject.toml").read_text()
+
+
+@pytest.mark.parametrize(
+    "version, commits, expected",
+    (
+        (None, (), "1.0.0"),
+        ("1.0.0", ("fix: Fix",), "1.0.1"),
+        ("1.0.0", ("fix: Fix\n\nBREAKING CHANGE: Moved",), "2.0.0"),
+        ("1.0.0rc0", (), "1.0.0"),
+    ),
+)
+def test_version_only(
+    capsys,
+    create_git_commit,
+    create_git_repository,
+    version,
+    commits,
+    expected,
+):
+    git = create_git_repository(
+        (
+            "pyproject.toml",
+            BADABUMP_CONFIG_SEMVER_TOML
+            + PYPROJECT_TOML.format(version=version or "1.0.0"),
+            "feat: Initial commit",
+        ),
+        tag=(f"v{version}", f"{version} Release") if version else None,
+    )
+    path = git.path
+    for idx, commit in enumerate(commits):
+        (path / "file.txt").write_text(f"{idx}")
+        create_git_commit(path, commit)
+
+    content = (path / "pyproject.toml").read_text()
+    assert main(["-C", str(path), "--version-only"]) == 0
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert f"Next version: {expected}\n" in captured.out
+    assert "ChangeLog" not in captured.out
+    assert (path / "pyproject.toml").read_text() == content
+    assert not (path / "CHANGELOG.md").exists()
+
+
+def test_version_only_no_commits(capsys, create_git_repository):
+    git = create_git_repository(
+        (
+            "pyproject.toml",
+            BADABUMP_CONFIG_SEMVER_TOML
+            + PYPROJECT_TOML.format(version="1.0.0"),
+            "feat: Initial commit",
+        ),
+        tag=("v1.0.0", "1.0.0 Release"),
+    )
+
+    assert main(["-C", str(git.path), "--version-only"]) == 1
+
+    captured = capsys.readouterr()
+    assert "ERROR: No commits found after: 'v1.0.0'. Exit..." in captured.err
+    assert "Next version: " not in captured.out
@@ -3,15 +3,20 @@ from unittest.mock import Mock
 
 import pytest
 
+from badabump.changelog import ChangeLog
 from badabump.cli.commands import (
     find_changelog_path,
+    find_last_tag,
     guess_version_files,
+    rewrite_file,
     run_post_bump_hook,
+    update_changelog_file,
     update_file,
     update_version_files,
 )
+from badabump.cli.output import diff
 from badabump.configs import ProjectConfig
-from badabump.enums import FormatTypeEnum, ProjectTypeEnum
+from badabump.enums import FormatTypeEnum, ProjectTypeEnum, TagStrategyEnum
 from badabump.exceptions import ConfigError
 from badabump.versions import Version
 
@@ -21,6 +26,41 @@ def ensure_dir(path: Path) -> Path:
     return path
 
 
+@pytest.mark.parametrize(
+    "tag_strategy, expected",
+    (
+        (TagStrategyEnum.describe, "nightly"),
+        (TagStrategyEnum.refs, "v20.10.0"),
+    ),
+)
+def test_find_last_tag(
+    create_git_commit,
+    create_git_repository,
+    create_git_tag,
+    tag_strategy,
+    expected,
+):
+    git = create_git_repository(
+        ("1.txt", None, "feat: Initial commit"),
+        tag=("v20.10.0", "20.10.0 Release"),
+    )
+    (git.path / "2.txt").write_text("")
+    create_git_commit(git.path, "fix: Fix")
+    create_git_tag(git.path, "v20.9.0", "Tag with lower version")
+    create_git_tag(git.path, "nightly", "Nightly build")
+
+    config = ProjectConfig(path=git.path, tag_strategy=tag_strategy)
+    assert find_last_tag(config, git) == expected
+
+
+@pytest.mark.parametrize("is_empty", (False, True))
+def test_find_last_tag_refs_no_tags(create_git_repository, is_empty):
+    commits = () if is_empty else (("1.txt", None, "feat: Initial commit"),)
+    git = create_git_repository(*commits)
+    config = ProjectConfig(path=git.path, tag_strategy=TagStrategyEnum.refs)
+    assert find_last_tag(config, git) is None
+
+
 @pytest.mark.parametrize(
     "format_type, file_name",
     (
@@ -172,6 +212,162 @@ def test_run_post_bump_hook_dry_run(capsys, tmpdir, file_name, expected):
     assert expected in captured.out
 
 
+@pytest.mark.parametrize(
+    "tag, content, expected",
+    (
+        ("v20.1.0", None, "# 20.1.0\n\n## Fixes:\n\n- Fix\n"),
+        (
+            "v20.1.0",
+            "# 20.0.0\n\n- Initial release\n",
+            "# 20.1.0\n\n## Fixes:\n\n- Fix\n\n# 20.0.0\n\n- Initial release\n",
+        ),
+        (
+            "v20.1.0rc0",
+            "# 20.0.0\n\n- Initial release\n",
+            (
+                "# 20.1.0 (In Development)\n\n## 20.1.0rc0\n\n### Fixes:\n\n"
+                "- Fix\n\n# 20.0.0\n\n- Initial release\n"
+            ),
+        ),
+        (
+            "v20.1.0",
+            "# 20.1.0 (In Development)\n\n## 20.1.0rc0\n\n- Fix\n",
+            "# 20.1.0\n\n## Fixes:\n\n- Fix\n\n## 20.1.0rc0\n\n- Fix\n",
+        ),
+    ),
+)
+def test_update_changelog_file(tmp_path, tag, content, expected):
+    path = ensure_dir(tmp_path / "project")
+    changelog_path = path / "CHANGELOG.md"
+    if content is not None:
+        changelog_path.write_text(content)
+        changelog_path.chmod(0o640)
+
+    config = ProjectConfig(path=path, changelog_file_include_date=False)
+    update_changelog_file(
+        config,
+        Version.from_tag(tag, config=config),
+        ChangeLog.from_git_commits(("fix: Fix",)),
+    )
+
+    assert changelog_path.read_text() == expected
+    assert list(path.iterdir()) == [changelog_path]
+    if content is not None:
+        assert changelog_path.stat().st_mode & 0o777 == 0o640
+
+
+@pytest.mark.parametrize("newline", ("\n", "\r\n"))
+def test_update_changelog_file_large(capsys, monkeypatch, newline, tmp_path):
+    monkeypatch.setattr("badabump.cli.commands.FILE_CHUNK_SIZE", 1024)
+
+    path = ensure_dir(tmp_path / "project")
+    changelog_path = path / "CHANGELOG.md"
+    prefix = "".join(f"Intro #{idx}{newline}" for idx in range(500))
+    history = "".join(
+        f"## 20.1.0rc{idx}{newline * 2}- Fix #{idx}{newline * 2}"
+        for idx in range(1000)
+    )
+    changelog_path.write_bytes(
+        (
+            f"{prefix}{newline}# 20.1.0 (In Development){newline * 2}"
+            f"{history}"
+        ).encode()
+    )
+
+    config = ProjectConfig(path=path, changelog_file_include_date=False)
+    update_changelog_file(
+        config,
+        Version.from_tag("v20.1.0rc1000", config=config),
+        ChangeLog.from_git_commits(("fix: Fix",)),
+    )
+
+    assert (
+        changelog_path.read_bytes()
+        == (
+            f"{prefix}{newline}# 20.1.0 (In Development){newline * 2}"
+            f"## 20.1.0rc1000{newline * 2}### Fixes:{newline * 2}"
+            f"- Fix{newline * 2}{history}"
+        ).encode()
+    )
+    assert "+ ## 20.1.0rc1000\n" in capsys.readouterr().out
+
+
+def test_update_changelog_file_prepend_crlf(tmp_path):
+    path = ensure_dir(tmp_path / "project")
+    changelog_path = path / "CHANGELOG.md"
+    changelog_path.write_bytes(b"# 1.0.0\r\n\r\n- Initial release\r\n")
+
+    config = ProjectConfig(path=path, changelog_file_include_date=False)
+    update_changelog_file(
+        config,
+        Version.from_tag("v20.1.1", config=config),
+        ChangeLog.from_git_commits(("fix: Fix",)),
+    )
+
+    assert changelog_path.read_bytes() == (
+        b"# 20.1.1\r\n\r\n## Fixes:\r\n\r\n- Fix\r\n\r\n"
+        b"# 1.0.0\r\n\r\n- Initial release\r\n"
+    )
+
+
+def test_update_changelog_file_full_diff(capsys, tmp_path):
+    path = ensure_dir(tmp_path / "project")
+    changelog_path = path / "CHANGELOG.md"
+    current_content = (
+        "# 20.1.0 (In Development)\n\n## 20.1.0rc1\n\n### Fixes:\n\n"
+        "- Fix\n\n# 20.0.0\n\n- Initial release\n"
+    )
+    changelog_path.write_text(current_content)
+
+    config = ProjectConfig(path=path, changelog_file_include_date=False)
+    update_changelog_file(
+        config,
+        Version.from_tag("v20.1.0", config=config),
+        ChangeLog.from_git_commits(("fix: Fix",)),
+    )
+
+    assert (
+        diff(current_content, changelog_path.read_text())
+        in capsys.readouterr().out
+    )
+
+
+def test_update_changelog_file_empty(tmp_path):
+    path = ensure_dir(tmp_path / "project")
+    changelog_path = path / "CHANGELOG.md"
+    changelog_path.write_text("")
+
+    config = ProjectConfig(path=path, changelog_file_include_date=False)
+    update_changelog_file(
+        config,
+        Version.from_tag("v20.1.0", config=config),
+        ChangeLog.from_git_commits(("fix: Fix",)),
+    )
+
+    assert changelog_path.read_text() == "# 20.1.0\n\n## Fixes:\n\n- Fix\n\n"
+
+
+def test_rewrite_file_error(tmp_path):
+    path = ensure_dir(tmp_path / "project") / "CHANGELOG.md"
+    path.write_text("# 1.0.0\n")
+
+    def rewrite_head(head, stream):
+        stream.write(head)
+        raise ValueError("Something went wrong")
+
+    with pytest.raises(ValueError):
+        rewrite_file(path, rewrite_head)
+
+    assert path.read_text() == "# 1.0.0\n"
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_update_file_content_not_found(tmp_path):
+    path = tmp_path / "pyproject.toml"
+    path.write_text('version = "1.0.0"\n')
+    assert update_file(path, 'version = "2.0.0"', 'version = "2.0.1"') is False
+
+
 def test_update_file_does_not_exist(tmpdir):
     assert (
         update_file(Path(tmpdir) / "does-not-exist.txt", "one", "two") is False
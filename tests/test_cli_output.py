@@ -1,6 +1,98 @@
+import random
+from difflib import ndiff
+
 import pytest
 
-from badabump.cli.output import github_actions_output
+from badabump.cli.output import diff, find_edit_region, github_actions_output
+
+HISTORY = "".join(f"## 1.0.0rc{idx}\n\n- Fix #{idx}\n\n" for idx in range(10))
+
+
+def full_diff(current_content, next_content):
+    return "".join(
+        item
+        for item in ndiff(
+            current_content.splitlines(keepends=True),
+            next_content.splitlines(keepends=True),
+        )
+        if item.startswith(("-", "+", "?"))
+    )
+
+
+@pytest.mark.parametrize(
+    "current_content, next_content",
+    (
+        ('version = "1.0.0"\n', 'version = "1.0.1"\n'),
+        (
+            f'[tool.poetry]\nversion = "1.0.0"\n\n{HISTORY}',
+            f'[tool.poetry]\nversion = "1.0.1"\n\n{HISTORY}',
+        ),
+        (
+            f"# 1.0.0 (In Development)\n\n{HISTORY}",
+            f"# 1.0.0\n\n## Fixes:\n\n- Fix\n\n{HISTORY}",
+        ),
+        (HISTORY, HISTORY),
+        ("", HISTORY),
+    ),
+)
+def test_diff(current_content, next_content):
+    assert diff(current_content, next_content) == full_diff(
+        current_content, next_content
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_diff_several_edits(seed):
+    rnd = random.Random(seed)
+    current_lines = [f"Line #{rnd.randrange(10)}\n" for _ in range(50)]
+    next_lines = current_lines.copy()
+    for _ in range(rnd.randint(2, 5)):
+        idx = rnd.randrange(len(next_lines))
+        if rnd.random() < 0.5:
+            next_lines[idx] = f"Edit #{rnd.randrange(10)}\n"
+        else:
+            next_lines.insert(idx, "\n")
+
+    current_content, next_content = "".join(current_lines), "".join(next_lines)
+    assert diff(current_content, next_content) == full_diff(
+        current_content, next_content
+    )
+
+
+def test_diff_large():
+    history = HISTORY * 1000
+    assert diff(
+        f"# 1.0.0 (In Development)\n\n{history}",
+        f"# 1.0.0\n\n## Fixes:\n\n- Fix\n\n{history}",
+    ) == (
+        "- # 1.0.0 (In Development)\n"
+        "+ # 1.0.0\n"
+        "+ \n"
+        "+ ## Fixes:\n"
+        "+ \n"
+        "+ - Fix\n"
+    )
+
+
+def test_diff_max_size():
+    assert diff("1\n2\n3\n4\n", "1\nTwo\nThree\n4\n", max_size=6) == (
+        "Diff is too large to show: 2 line(s) removed, 2 line(s) added after "
+        "line 1\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "current_lines, next_lines, expected",
+    (
+        ((), (), (0, 0, 0)),
+        (("1", "2"), ("1", "2"), (2, 2, 2)),
+        (("1", "2", "3"), ("1", "3"), (1, 2, 1)),
+        (("1", "3"), ("1", "2", "3"), (1, 1, 2)),
+        (("1", "1"), ("1", "1", "1"), (2, 2, 3)),
+    ),
+)
+def test_find_edit_region(current_lines, next_lines, expected):
+    assert find_edit_region(current_lines, next_lines) == expected
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,136 @@
+import pytest
+
+from badabump.changelog import ConventionalCommit
+from badabump.commit_cache import (
+    COMMIT_CACHE_HEADER,
+    CommitCache,
+    get_default_commit_cache_path,
+    parse_commits,
+)
+
+FEATURE_COMMIT = ConventionalCommit(
+    raw_commit_type="feat(cache)",
+    description="Add commit cache",
+    body="Multiline\nbody with\ttab & юнікод",
+)
+FIX_COMMIT = ConventionalCommit(
+    raw_commit_type="fix", description="Fix something"
+)
+
+
+@pytest.fixture()
+def repository(create_git_commit, create_git_repository):
+    git = create_git_repository(
+        ("README.md", "Initial", "feat: Initial commit"),
+        tag=("v1.0.0", "1.0.0 Release"),
+    )
+    for idx, commit in enumerate(
+        (
+            "feat(cache): Add commit cache\n\nIssue: DEV-1",
+            "Not a conventional commit",
+            "fix: Fix something",
+        )
+    ):
+        (git.path / "README.md").write_text(f"Update #{idx}")
+        create_git_commit(git.path, commit)
+    return git
+
+
+def test_commit_cache_eviction(tmp_path):
+    cache = CommitCache(path=tmp_path / "commits.cache", max_size=2)
+    cache.set("1", FEATURE_COMMIT)
+    cache.set("2", FIX_COMMIT)
+    assert cache.get("1") == FEATURE_COMMIT
+
+    cache.set("3", FIX_COMMIT)
+    assert len(cache) == 2
+    assert "1" in cache
+    assert "2" not in cache
+    assert cache.get("2") is None
+
+
+def test_commit_cache_save_load(tmp_path):
+    path = tmp_path / "badabump" / "commits.cache"
+
+    cache = CommitCache(path=path)
+    cache.set("1", FEATURE_COMMIT)
+    cache.set("2", FIX_COMMIT)
+    cache.save()
+
+    assert path.read_text().splitlines()[0] == COMMIT_CACHE_HEADER
+    assert list(path.parent.iterdir()) == [path]
+
+    loaded = CommitCache.load(path)
+    assert loaded.entries == cache.entries
+
+    loaded = CommitCache.load(path, max_size=1)
+    assert list(loaded.entries) == ["2"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    (
+        "",
+        '# Unknown header\n1\t["fix","Fix",null]\n',
+        "\n".join(
+            (
+                COMMIT_CACHE_HEADER,
+                "1",
+                '2\t["fix","Fix"]',
+                "3\t42",
+                '4\t["","Fix",null]',
+                '5\t["fix","Fix",42]',
+                '\t["fix","Fix",null]',
+            )
+        ),
+    ),
+)
+def test_commit_cache_load_invalid(tmp_path, content):
+    path = tmp_path / "commits.cache"
+    path.write_text(content)
+    assert len(CommitCache.load(path)) == 0
+
+
+def test_commit_cache_load_missing(tmp_path):
+    assert len(CommitCache.load(tmp_path / "commits.cache")) == 0
+
+
+def test_get_default_commit_cache_path(repository):
+    assert get_default_commit_cache_path(repository) == (
+        repository.path / ".git" / "badabump" / "commits.cache"
+    )
+
+
+def test_parse_commits(repository, tmp_path):
+    commit_ids = repository.list_commit_ids("v1.0.0")
+    assert len(commit_ids) == 3
+
+    cache = CommitCache(path=tmp_path / "commits.cache")
+    commits = parse_commits(repository, commit_ids, cache=cache, strict=False)
+    assert [item.raw_commit_type for item in commits] == [
+        "fix",
+        "unknown",
+        "feat(cache)",
+    ]
+    assert commits[2].issues == ("DEV-1",)
+
+    # Non-conventional commit is not cached
+    assert list(cache.entries) == [commit_ids[0], commit_ids[2]]
+    assert (
+        parse_commits(repository, commit_ids, cache=cache, strict=False)
+        == commits
+    )
+
+    cache.set(commit_ids[0], FEATURE_COMMIT)
+    assert parse_commits(
+        repository, commit_ids, cache=cache, strict=False
+    ) == (FEATURE_COMMIT, commits[1], commits[2])
+
+
+def test_parse_commits_strict(repository, tmp_path):
+    cache = CommitCache(path=tmp_path / "commits.cache")
+    commit_ids = repository.list_commit_ids("v1.0.0")
+    parse_commits(repository, commit_ids[2:], cache=cache, strict=False)
+
+    with pytest.raises(ValueError):
+        parse_commits(repository, commit_ids, cache=cache, strict=True)
@@ -2,7 +2,12 @@ import pytest
 
 from badabump.configs import ProjectConfig, UpdateConfig
 from badabump.constants import DEFAULT_SEMVER_SCHEMA
-from badabump.enums import VersionTypeEnum
+from badabump.enums import (
+    FormatTypeEnum,
+    ProjectTypeEnum,
+    TagStrategyEnum,
+    VersionTypeEnum,
+)
 
 DEFAULT_KWARGS = {
     "is_breaking_change": False,
@@ -12,6 +17,34 @@ DEFAULT_KWARGS = {
 }
 
 
+@pytest.mark.parametrize(
+    "content, expected",
+    (
+        ("", TagStrategyEnum.describe),
+        ('[tool.badabump]\ntag_strategy = "refs"\n', TagStrategyEnum.refs),
+    ),
+)
+def test_project_config_tag_strategy(tmp_path, content, expected):
+    (tmp_path / "pyproject.toml").write_text(content)
+    assert ProjectConfig.from_path(tmp_path).tag_strategy == expected
+
+
+def test_project_config_notices_new_files(tmp_path):
+    path = tmp_path / "project"
+    path.mkdir()
+    (path / "pyproject.toml").write_text("")
+
+    config = ProjectConfig.from_path(path)
+    assert config.project_type == ProjectTypeEnum.python
+
+    (path / "package.json").write_text("{}")
+    (path / "CHANGELOG.rst").write_text("")
+
+    config = ProjectConfig.from_path(path)
+    assert config.project_type == ProjectTypeEnum.javascript
+    assert config.changelog_format_type_file == FormatTypeEnum.rst
+
+
 def test_project_config_semver_schema():
     assert (
         ProjectConfig(version_type=VersionTypeEnum.semver).version_schema
@@ -0,0 +1,94 @@
+import os
+
+import pytest
+
+from badabump.directory_index import DirectoryIndex
+
+
+@pytest.fixture()
+def directory_index():
+    return DirectoryIndex()
+
+
+def backdate(*paths):
+    for path in paths:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 3_600 * 10**9))
+
+
+def test_directory_index(directory_index, tmp_path):
+    (tmp_path / "src" / "project").mkdir(parents=True)
+    (tmp_path / "CHANGELOG.md").write_text("")
+    (tmp_path / "README.md").write_text("")
+    backdate(tmp_path, tmp_path / "src")
+
+    assert directory_index.exists(tmp_path / "CHANGELOG.md")
+    assert directory_index.exists(tmp_path / "package.json") is False
+    assert directory_index.is_dir(tmp_path / "src")
+    assert directory_index.is_dir(tmp_path / "README.md") is False
+    assert sorted(directory_index.iter_matches(tmp_path, "*.md")) == [
+        tmp_path / "CHANGELOG.md",
+        tmp_path / "README.md",
+    ]
+    assert list(directory_index.iter_matches(tmp_path, "*.MD")) == []
+    assert directory_index.scans == 1
+
+    assert directory_index.is_dir(tmp_path / "src" / "project")
+    assert directory_index.scans == 2
+
+    directory_index.clear()
+    assert directory_index.scans == 0
+    assert directory_index.entries == {}
+
+
+def test_directory_index_broken_symlink(directory_index, tmp_path):
+    (tmp_path / "CHANGELOG.md").symlink_to(tmp_path / "does-not-exist.md")
+    (tmp_path / "README.md").write_text("")
+    (tmp_path / "README.rst").symlink_to(tmp_path / "README.md")
+
+    assert (tmp_path / "CHANGELOG.md").exists() is False
+    assert directory_index.exists(tmp_path / "CHANGELOG.md") is False
+    assert directory_index.exists(tmp_path / "README.rst")
+
+
+def test_directory_index_rescan(directory_index, tmp_path):
+    backdate(tmp_path)
+    assert directory_index.exists(tmp_path / "CHANGELOG.md") is False
+
+    stat = tmp_path.stat()
+    (tmp_path / "CHANGELOG.md").write_text("")
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert directory_index.exists(tmp_path / "CHANGELOG.md")
+    assert directory_index.exists(tmp_path / "README.md") is False
+    assert directory_index.scans == 2
+
+
+def test_directory_index_rescan_recently_modified(directory_index, tmp_path):
+    assert directory_index.exists(tmp_path / "CHANGELOG.md") is False
+
+    # Entry added within same mtime tick does not change directory mtime
+    stat = tmp_path.stat()
+    (tmp_path / "CHANGELOG.md").write_text("")
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert directory_index.exists(tmp_path / "CHANGELOG.md")
+    assert directory_index.scans == 2
+
+
+def test_directory_index_skip_missing_subdirectory(directory_index, tmp_path):
+    (tmp_path / "project.py").write_text("")
+
+    assert directory_index.exists(tmp_path / "project.py")
+    assert directory_index.list_names(tmp_path / "src") == {}
+    assert (
+        directory_index.exists(tmp_path / "project" / "__init__.py") is False
+    )
+    assert directory_index.scans == 1
+
+
+@pytest.mark.parametrize("name", ("does-not-exist", "file.txt"))
+def test_directory_index_not_a_directory(directory_index, tmp_path, name):
+    (tmp_path / "file.txt").write_text("")
+    assert directory_index.list_names(tmp_path / name) == {}
+    assert directory_index.exists(tmp_path / name / "package.json") is False
@@ -1,7 +1,11 @@
+import dataclasses
 import subprocess
 
 import pytest
 
+from badabump.enums import GitBackendEnum
+from badabump.git import CatFile
+
 COMMITS = (
     "feat: Initial commit",
     "feat: Add new file",
@@ -28,6 +32,55 @@ def test_empty_repository(create_git_repository):
     assert git.retrieve_tag_body("v1.0.0") == ""
 
 
+@pytest.mark.parametrize("backend", GitBackendEnum)
+def test_iter_commits(create_git_repository, backend):
+    git = create_git_repository(
+        *((f"{idx}.txt", None, commit) for idx, commit in enumerate(COMMITS))
+    )
+    expected = tuple(item.strip() for item in COMMITS[1:])
+
+    with dataclasses.replace(git, backend=backend) as git:
+        commits = git.iter_commits("HEAD~3", reverse=True)
+        assert not isinstance(commits, tuple)
+        assert tuple(commits) == expected[-3:]
+        assert tuple(git.iter_commits("HEAD~3")) == expected[-3:][::-1]
+
+
+@pytest.mark.parametrize("backend", GitBackendEnum)
+def test_iter_commits_grep(create_git_repository, backend):
+    git = create_git_repository(
+        *((f"{idx}.txt", None, commit) for idx, commit in enumerate(COMMITS))
+    )
+    with dataclasses.replace(git, backend=backend) as git:
+        assert tuple(git.iter_commits("HEAD~4", grep="Issue: ")) == tuple(
+            item.strip()
+            for item in reversed(COMMITS[-4:])
+            if "Issue: " in item
+        )
+
+
+@pytest.mark.parametrize("backend", GitBackendEnum)
+def test_iter_commit_subjects(create_git_repository, backend):
+    git = create_git_repository(
+        ("1.txt", None, COMMITS[0]),
+        ("2.txt", None, "fix: Multi\nline subject\n\nBody"),
+    )
+    with dataclasses.replace(git, backend=backend) as git:
+        assert tuple(git.iter_commit_subjects("HEAD~1")) == (
+            "fix: Multi line subject",
+        )
+
+
+def test_list_commit_ids(create_git_repository):
+    git = create_git_repository(
+        *((f"{idx}.txt", None, commit) for idx, commit in enumerate(COMMITS))
+    )
+    commit_ids = git.list_commit_ids("HEAD~3")
+    assert len(commit_ids) == 3
+    assert git.list_commit_ids("HEAD~3", reverse=True) == commit_ids[::-1]
+    assert git.retrieve_commits(commit_ids) == git.list_commits("HEAD~3")
+
+
 def test_list_commits(create_git_repository):
     git = create_git_repository(
         ("1.txt", None, COMMITS[0]), ("2.txt", None, COMMITS[1])
@@ -39,11 +92,50 @@ def test_list_commits(create_git_repository):
     assert git.list_commits(commit_id.strip().decode("utf-8")) == (COMMITS[1],)
 
 
+def test_list_commits_many(create_git_repository):
+    git = create_git_repository(
+        *((f"{idx}.txt", None, commit) for idx, commit in enumerate(COMMITS))
+    )
+
+    commit_id = subprocess.check_output(
+        ["git", "rev-list", "--max-parents=0", "HEAD"], cwd=git.path
+    )
+    assert git.list_commits(commit_id.strip().decode("utf-8")) == tuple(
+        item.strip() for item in reversed(COMMITS[1:])
+    )
+
+
 def test_list_commits_empty(create_git_repository):
     git = create_git_repository(("1.txt", None, COMMITS[0]))
     assert git.list_commits("HEAD") == ()
 
 
+def test_list_commits_large_body(create_git_repository):
+    body = "\n".join(["- Item"] * 10_000)
+    commit = f"docs: Add large README\n\n{body}"
+    git = create_git_repository(
+        ("1.txt", None, COMMITS[0]), ("2.txt", None, commit)
+    )
+    assert git.list_commits("HEAD~1") == (commit,)
+
+
+def test_list_commits_unknown_ref(create_git_repository):
+    git = create_git_repository(("1.txt", None, COMMITS[0]))
+    with pytest.raises(subprocess.CalledProcessError):
+        git.list_commits("v1.0.0")
+
+
+def test_empty_repository_cat_file(create_git_repository):
+    with dataclasses.replace(
+        create_git_repository(), backend=GitBackendEnum.cat_file
+    ) as git:
+        with pytest.raises(ValueError):
+            git.retrieve_last_commit()
+
+        assert git.retrieve_tag_subject("v1.0.0") == ""
+        assert git.retrieve_tag_body("v1.0.0") == ""
+
+
 def test_retrieve_last_commit(create_git_repository):
     git = create_git_repository(
         ("1.txt", None, COMMITS[0]),
@@ -52,6 +144,34 @@ def test_retrieve_last_commit(create_git_repository):
     assert git.retrieve_last_commit() == COMMITS[1]
 
 
+@pytest.mark.parametrize("backend", GitBackendEnum)
+def test_retrieve_last_commit_with_body(create_git_repository, backend):
+    git = create_git_repository(
+        ("1.txt", None, COMMITS[0]),
+        ("2.txt", None, COMMITS[4]),
+    )
+    with dataclasses.replace(git, backend=backend) as git:
+        assert git.retrieve_last_commit() == COMMITS[4].strip()
+
+
+def test_list_merged_tags(create_git_repository, create_git_tag):
+    git = create_git_repository(
+        ("1.txt", None, COMMITS[0]), tag=("v1.0.0", "1.0.0 Release")
+    )
+    create_git_tag(git.path, "nightly", "Nightly build")
+
+    subprocess.check_call(["git", "checkout", "-b", "feature"], cwd=git.path)
+    (git.path / "2.txt").write_text("")
+    subprocess.check_call(["git", "add", "."], cwd=git.path)
+    subprocess.check_call(["git", "commit", "-m", COMMITS[1]], cwd=git.path)
+    create_git_tag(git.path, "v2.0.0", "2.0.0 Release")
+    subprocess.check_call(["git", "checkout", "-"], cwd=git.path)
+
+    assert git.list_merged_tags("v*") == ("v1.0.0",)
+    assert git.list_merged_tags("v*", ref="feature") == ("v1.0.0", "v2.0.0")
+    assert git.list_merged_tags("release/*") == ()
+
+
 def test_retrieve_last_tag(create_git_repository):
     git = create_git_repository(
         ("1.txt", None, COMMITS[0]), tag=("v1.0.0", "1.0.0 Release")
@@ -66,6 +186,15 @@ def test_retrieve_last_tag_or_none(create_git_repository):
     assert git.retrieve_last_tag_or_none() == "v1.0.0"
 
 
+def test_iter_output_not_terminated(create_git_repository):
+    git = create_git_repository(
+        ("1.txt", None, COMMITS[0]), ("2.txt", None, COMMITS[1])
+    )
+    assert tuple(
+        git._iter_output(["git", "log", "-z", "--pretty=format:%s"])
+    ) == (COMMITS[1], COMMITS[0])
+
+
 @pytest.mark.parametrize(
     "message, expected_subject, expected_body",
     (
@@ -86,11 +215,81 @@ Features:
         ),
     ),
 )
+@pytest.mark.parametrize("backend", GitBackendEnum)
 def test_retrieve_tag_details(
-    create_git_repository, message, expected_subject, expected_body
+    create_git_repository, backend, message, expected_subject, expected_body
 ):
     git = create_git_repository(
         ("1.txt", None, COMMITS[0]), tag=("v1.0.0", message)
     )
-    assert git.retrieve_tag_subject("v1.0.0") == expected_subject
-    assert git.retrieve_tag_body("v1.0.0") == expected_body
+    with dataclasses.replace(git, backend=backend) as git:
+        assert git.retrieve_tag_subject("v1.0.0") == expected_subject
+        assert git.retrieve_tag_body("v1.0.0") == expected_body
+
+
+@pytest.mark.parametrize(
+    "message",
+    (
+        "1.0.0 Release",
+        "1.0.0\nRelease\n\nFeatures:\n---------\n\n- Initial release\n",
+        """1.0.0 Release
+-----BEGIN PGP SIGNATURE-----
+
+iQEzBAABCAAdFiEE
+-----END PGP SIGNATURE-----
+""",
+        """1.0.0 Release
+
+- Initial release
+-----BEGIN SSH SIGNATURE-----
+U1NIU0lHAAAAAQ
+-----END SSH SIGNATURE-----
+""",
+    ),
+)
+def test_retrieve_tag_details_cat_file_same_as_subprocess(
+    create_git_repository, create_git_tag, message
+):
+    git = create_git_repository(
+        ("1.txt", None, COMMITS[0]), tag=("v1.0.0", message)
+    )
+    create_git_tag(git.path, "v1.0.1", message)
+    subprocess.check_call(["git", "tag", "v1.0.2"], cwd=git.path)
+
+    with dataclasses.replace(git, backend=GitBackendEnum.cat_file) as cat_git:
+        for tag in ("v1.0.0", "v1.0.1", "v1.0.2"):
+            assert cat_git.retrieve_tag_subject(
+                tag
+            ) == git.retrieve_tag_subject(tag)
+            assert cat_git.retrieve_tag_body(tag) == git.retrieve_tag_body(tag)
+
+
+def test_cat_file(create_git_repository):
+    git = create_git_repository(("1.txt", None, COMMITS[0]))
+
+    cat_file = CatFile(path=git.path)
+    assert cat_file.read_object("HEAD")[0] == "commit"
+    assert cat_file.read_object("HEAD:1.txt") == ("blob", b"")
+    assert cat_file.read_object("does-not-exist") is None
+    assert cat_file.read_object("HEAD\nHEAD") is None
+
+    process = cat_file.process
+    cat_file.close()
+    assert process.returncode == 0
+    assert cat_file.process is None
+    cat_file.close()
+
+
+@pytest.mark.parametrize("is_exited", (False, True))
+def test_cat_file_unexpected_exit(create_git_repository, is_exited):
+    git = create_git_repository(("1.txt", None, COMMITS[0]))
+
+    cat_file = CatFile(path=git.path)
+    cat_file.process = subprocess.Popen(
+        ["true"], stdin=subprocess.PIPE, stdout=subprocess.PIPE
+    )
+    if is_exited:
+        cat_file.process.wait()
+    with pytest.raises(ValueError):
+        cat_file.read_object("HEAD")
+    cat_file.close()
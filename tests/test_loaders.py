@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+from badabump.loaders import FileCache, loads_json, loads_toml
+
+
+@pytest.fixture()
+def file_cache():
+    return FileCache()
+
+
+def test_file_cache(file_cache, tmp_path):
+    path = tmp_path / "package.json"
+    path.write_text('{"version": "1.0.0"}')
+
+    data = file_cache.load(path, loads_json)
+    assert data == {"version": "1.0.0"}
+    assert file_cache.load(path, loads_json) is data
+    assert (file_cache.hits, file_cache.misses) == (1, 1)
+
+    file_cache.clear()
+    assert (file_cache.hits, file_cache.misses) == (0, 0)
+    assert file_cache.entries == {}
+
+
+@pytest.mark.parametrize(
+    "content, is_touched",
+    (
+        ('version = "1.0.1"\n', True),
+        ('version = "1.0.10"\n', False),
+    ),
+)
+def test_file_cache_invalidated(file_cache, tmp_path, content, is_touched):
+    path = tmp_path / "pyproject.toml"
+    path.write_text('version = "1.0.0"\n')
+    assert file_cache.load(path, loads_toml) == {"version": "1.0.0"}
+
+    stat = path.stat()
+    path.write_text(content)
+    if is_touched:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    else:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert file_cache.load(path, loads_toml) == loads_toml(content)
+    assert (file_cache.hits, file_cache.misses) == (0, 2)
+
+
+def test_file_cache_missing(file_cache, tmp_path):
+    assert file_cache.load(tmp_path / "pyproject.toml", loads_toml) is None
+    assert (file_cache.hits, file_cache.misses) == (0, 0)
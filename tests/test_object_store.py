@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+import subprocess
+from typing import TYPE_CHECKING
+
+import pytest
+
+from badabump.enums import GitBackendEnum
+from badabump.exceptions import ObjectStoreError
+from badabump.git import CatFile, Git
+from badabump.object_store import ObjectStore, parse_commit_headers
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+README = "\n".join(
+    f"Line #{idx}: Lorem ipsum dolor sit amet" for idx in range(100)
+)
+
+
+def commit_at(path: Path, message: str, timestamp: int) -> None:
+    date = f"{timestamp} +0000"
+    subprocess.check_call(["git", "add", "."], cwd=path)
+    subprocess.check_call(
+        ["git", "commit", "--allow-empty", "-m", message],
+        cwd=path,
+        env={
+            **os.environ,
+            "GIT_AUTHOR_DATE": date,
+            "GIT_COMMITTER_DATE": date,
+        },
+    )
+
+
+def git_output(path: Path, *args: str) -> str:
+    return subprocess.check_output(["git", *args], cwd=path).decode("utf-8")
+
+
+@pytest.fixture()
+def repository(create_git_repository):
+    git = create_git_repository(
+        ("README.md", README, "feat: Initial commit"),
+        tag=("v1.0.0", "1.0.0 Release"),
+    )
+    path = git.path
+
+    for idx in range(5):
+        (path / "README.md").write_text(f"{README}\nLine #{100 + idx}")
+        commit_at(path, f"fix: Update README #{idx}", 1_700_000_000 + idx)
+
+    return git
+
+
+@pytest.fixture()
+def merge_repository(create_git_repository):
+    git = create_git_repository(
+        ("README.md", README, "feat: Initial commit"),
+        tag=("v1.0.0", "1.0.0 Release"),
+    )
+    path = git.path
+    branch = git_output(path, "rev-parse", "--abbrev-ref", "HEAD").strip()
+    subprocess.check_call(["git", "checkout", "-b", "feature"], cwd=path)
+    commit_at(path, "feat: Feature #1", 1_700_000_010)
+    commit_at(path, "feat: Feature #2", 1_700_000_030)
+
+    subprocess.check_call(["git", "checkout", branch], cwd=path)
+    commit_at(path, "fix: Fix #1", 1_700_000_020)
+    commit_at(path, "fix: Fix #2", 1_700_000_040)
+    subprocess.check_call(
+        ["git", "merge", "--no-ff", "-m", "chore: Merge feature", "feature"],
+        cwd=path,
+    )
+    commit_at(path, "docs: Update docs", 1_700_000_050)
+    return git
+
+
+@pytest.mark.parametrize(
+    "repack_args",
+    (
+        None,
+        ("repack", "-adf", "--depth=50", "--window=50"),
+        (
+            "-c",
+            "repack.useDeltaBaseOffset=false",
+            "repack",
+            "-adf",
+            "--depth=50",
+            "--window=50",
+        ),
+    ),
+)
+def test_read_raw_same_as_cat_file(repository, repack_args):
+    path = repository.path
+    if repack_args is not None:
+        subprocess.check_call(["git", *repack_args], cwd=path)
+
+    object_ids = git_output(
+        path,
+        "cat-file",
+        "--batch-all-objects",
+        "--batch-check=%(objectname)",
+    ).split()
+    assert object_ids
+
+    store = ObjectStore.from_path(path)
+    cat_file = CatFile(path=path)
+    try:
+        for oid in object_ids:
+            assert store.read_raw(oid) == cat_file.read_object(oid)
+    finally:
+        cat_file.close()
+        store.close()
+
+
+@pytest.mark.parametrize("is_packed", (False, True))
+@pytest.mark.parametrize("from_ref", ("v1.0.0", "HEAD~3", "HEAD"))
+def test_list_commits_same_as_git_log(merge_repository, is_packed, from_ref):
+    path = merge_repository.path
+    if is_packed:
+        subprocess.check_call(["git", "gc", "-q"], cwd=path)
+
+    store = ObjectStore.from_path(path)
+    try:
+        if from_ref == "HEAD~3":
+            from_ref = git_output(path, "rev-parse", from_ref).strip()
+        assert store.list_commits(from_ref) == merge_repository.list_commits(
+            from_ref
+        )
+    finally:
+        store.close()
+
+
+def test_list_commits_feature_branch(merge_repository):
+    path = merge_repository.path
+    store = ObjectStore.from_path(path)
+    head = git_output(path, "rev-parse", "HEAD").strip()
+    assert store.list_commits(head, "feature") == ()
+    assert store.list_commits("feature", head) == (
+        "docs: Update docs",
+        "chore: Merge feature",
+        "fix: Fix #2",
+        "fix: Fix #1",
+    )
+
+
+def test_list_commits_not_a_commit(repository):
+    store = ObjectStore.from_path(repository.path)
+    tree_id = git_output(repository.path, "rev-parse", "HEAD^{tree}").strip()
+
+    with pytest.raises(ObjectStoreError):
+        store.list_commits(tree_id)
+    with pytest.raises(ObjectStoreError):
+        store.list_commits("v2.0.0")
+    with pytest.raises(ObjectStoreError):
+        store.read_commit(tree_id)
+
+
+@pytest.mark.parametrize("is_packed", (False, True))
+def test_resolve(repository, is_packed):
+    path = repository.path
+    if is_packed:
+        subprocess.check_call(["git", "pack-refs", "--all"], cwd=path)
+
+    branch = git_output(path, "rev-parse", "--abbrev-ref", "HEAD").strip()
+    head = git_output(path, "rev-parse", "HEAD").strip()
+    tag = git_output(path, "rev-parse", "v1.0.0").strip()
+
+    store = ObjectStore.from_path(path)
+    assert store.resolve("HEAD") == head
+    assert store.resolve(head) == head
+    assert store.resolve(branch) == head
+    assert store.resolve(f"refs/heads/{branch}") == head
+    assert store.resolve(f"heads/{branch}") == head
+    assert store.resolve("v1.0.0") == tag
+    assert store.resolve("tags/v1.0.0") == tag
+    assert store.resolve("does-not-exist") is None
+    assert store.read_object("does-not-exist") is None
+
+
+@pytest.mark.parametrize(
+    "name", ("", "HEAD~1", "HEAD^", "main:README.md", "abc123", "@{-1}")
+)
+def test_resolve_unsupported(repository, name):
+    store = ObjectStore.from_path(repository.path)
+    with pytest.raises(ObjectStoreError):
+        store.resolve(name)
+
+
+@pytest.mark.parametrize(
+    "content", ("ref: refs/heads/loop", "not an object id")
+)
+def test_resolve_invalid_ref(repository, content):
+    (repository.path / ".git" / "refs" / "heads" / "loop").write_text(content)
+
+    store = ObjectStore.from_path(repository.path)
+    with pytest.raises(ObjectStoreError):
+        store.resolve("loop")
+
+
+def test_read_raw_missing(repository):
+    store = ObjectStore.from_path(repository.path)
+    with pytest.raises(ObjectStoreError):
+        store.read_raw("0" * 40)
+
+
+@pytest.mark.parametrize(
+    "file_name, content",
+    (
+        ("objects/info/alternates", "/tmp/objects\n"),
+        ("commondir", "../..\n"),
+        (
+            "config",
+            (
+                "[core]\n\trepositoryformatversion = 1\n"
+                "[extensions]\n\tobjectFormat = sha256\n"
+            ),
+        ),
+        (
+            "packed-refs",
+            f"{'0' * 40} refs/replace/{'1' * 40}\n",
+        ),
+    ),
+)
+def test_from_path_unsupported(repository, file_name, content):
+    path = repository.path
+    (path / ".git" / file_name).write_text(content)
+    assert ObjectStore.from_path(path) is None
+
+    with dataclasses.replace(
+        repository, backend=GitBackendEnum.object_store
+    ) as git:
+        assert git.reader is None
+
+
+def test_from_path_git_dir_env_var(monkeypatch, repository):
+    monkeypatch.setenv("GIT_DIR", str(repository.path / ".git"))
+    assert ObjectStore.from_path(repository.path) is None
+
+
+def test_from_path_git_file(tmp_path):
+    (tmp_path / ".git").write_text("gitdir: /tmp/repo/.git/worktrees/repo\n")
+    assert ObjectStore.from_path(tmp_path) is None
+
+
+def test_from_path_no_repository(tmp_path):
+    assert ObjectStore.from_path(tmp_path) is None
+
+
+def test_from_path_subdirectory(repository):
+    path = repository.path / "src"
+    path.mkdir()
+    store = ObjectStore.from_path(path)
+    assert store.git_dir == repository.path / ".git"
+
+
+def test_git_object_store_fallback(repository):
+    expected = repository.list_commits("HEAD~2")
+    with dataclasses.replace(
+        repository, backend=GitBackendEnum.object_store
+    ) as git:
+        assert isinstance(git.reader, ObjectStore)
+        assert git.list_commits("HEAD~2") == expected
+        assert git.list_commits("v1.0.0") == repository.list_commits("v1.0.0")
+        assert git.retrieve_last_commit() == "fix: Update README #4"
+        assert git.retrieve_tag_subject("v1.0.0") == "1.0.0 Release"
+        assert git.retrieve_tag_subject("v1.0.0 ") == ""
+
+
+def test_parse_commit_headers():
+    parent = "1" * 40
+    content = f"""tree {"0" * 40}
+parent {parent}
+author Name <name@example.com> 1700000000 +0100
+committer Name <name@example.com> 1700000001 +0100
+
+feat: Commit
+""".encode()
+    assert parse_commit_headers(content) == ((parent,), 1700000001)
+
+
+def test_parse_commit_headers_unsupported_encoding():
+    content = b"""tree 0000000000000000000000000000000000000000
+author Name <name@example.com> 1700000000 +0100
+committer Name <name@example.com> 1700000001 +0100
+encoding ISO-8859-1
+
+feat: Commit
+"""
+    with pytest.raises(ObjectStoreError):
+        parse_commit_headers(content)
+
+
+def test_git_object_store_read(repository):
+    git = Git(path=repository.path, backend=GitBackendEnum.object_store)
+    try:
+        assert git.retrieve_last_commit() == repository.retrieve_last_commit()
+    finally:
+        git.close()
+        git.close()
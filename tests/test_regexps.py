@@ -2,7 +2,7 @@ import re
 
 import pytest
 
-from badabump.regexps import ensure_regexp_dots, to_regexp
+from badabump.regexps import ensure_regexp_dots, to_glob, to_regexp
 
 
 @pytest.mark.parametrize(
@@ -29,3 +29,20 @@ def test_ensure_regexp_dots(value, expected):
 )
 def test_to_regexp(value, expected):
     assert to_regexp(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    (
+        ("v{version}", "v*"),
+        ("release/{version}", "release/*"),
+        ("{name}-{version}", "*-*"),
+        ("[build]?v{version}", "[[]build][?]v*"),
+    ),
+)
+def test_to_glob(value, expected):
+    assert to_glob(value) == expected
+
+
+def test_to_regexp_cached():
+    assert to_regexp("v{version}") is to_regexp("v{version}")
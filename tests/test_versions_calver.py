@@ -168,3 +168,26 @@ def test_calver_update_year_change(schema, version, update_kwargs, expected):
 
     with time_machine.travel("2021-01-11T00:00:00+00:00"):
         assert current.update(update_config).format() == expected
+
+
+def test_calver_ordering():
+    versions = [
+        CalVer(year=2020, minor=1, micro=0),
+        CalVer(year=2020, minor=1, micro=1),
+        CalVer(year=2020, minor=2, micro=0),
+        CalVer(year=2021, minor=1, micro=0),
+    ]
+    assert sorted(versions, reverse=True) == versions[::-1]
+    assert max(versions) == CalVer(year=2021, minor=1, micro=0)
+    with pytest.raises(TypeError):
+        assert CalVer(year=2020) < "20.1.0"
+
+
+def test_calver_ordering_different_schemas():
+    first = CalVer(year=2020, minor=1, micro=0, schema="YY.MINOR.MICRO")
+    second = CalVer(year=2020, minor=1, micro=0, schema="YYYY.MINOR.MICRO")
+    assert first != second
+    assert first < second
+    assert not first > second
+    assert not second <= first
+    assert sorted((second, first)) == [first, second]
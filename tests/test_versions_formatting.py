@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+import pytest
+
+from badabump.versions import calver, pre_release, semver
+from badabump.versions.calver import CalVer
+from badabump.versions.formatting import (
+    bind_version_formatter,
+    compile_version_formatter,
+)
+
+
+def test_bind_version_formatter():
+    get_version_formatter = bind_version_formatter(
+        calver.SCHEMA_PARTS_FORMATTING
+    )
+    formatter = get_version_formatter("YYYY.0M.MICRO")
+    assert formatter is get_version_formatter("YYYY.0M.MICRO")
+    assert get_version_formatter.cache_info().misses == 1
+    assert formatter.segments == (
+        ("", "year", ""),
+        (".", "month", "02d"),
+        (".", "micro", ""),
+    )
+    assert formatter.format(CalVer(year=2024, month=1, micro=2)) == "2024.01.2"
+
+
+def test_version_formatter_format_map():
+    formatter = compile_version_formatter(
+        "-TYPE.NUMBER", pre_release.SCHEMA_PARTS_FORMATTING
+    )
+    assert formatter.format_map({"type": "rc", "number": 1}) == "-rc.1"
+
+
+@pytest.mark.parametrize(
+    "schema, expected",
+    (
+        ("MAJOR.MINOR.PATCH", "1.2.3"),
+        ("vMAJOR", "v1"),
+        ("MAJOR.MINOR-final", "1.2-final"),
+    ),
+)
+def test_version_formatter_format(schema, expected):
+    formatter = compile_version_formatter(
+        schema, semver.SCHEMA_PARTS_FORMATTING
+    )
+    value = SimpleNamespace(major=1, minor=2, patch=3)
+    assert formatter.format(value) == expected
@@ -0,0 +1,37 @@
+import pytest
+
+from badabump.versions import calver, semver
+from badabump.versions.parsing import (
+    bind_schema_matcher,
+    build_schema_regexp,
+    parse_version,
+)
+
+
+def test_bind_schema_matcher():
+    get_schema_matcher = bind_schema_matcher(semver.SCHEMA_PARTS_PARSING)
+    matcher = get_schema_matcher(semver.SCHEMA)
+    assert matcher is get_schema_matcher(semver.SCHEMA)
+    assert get_schema_matcher.cache_info().misses == 1
+    assert matcher.pattern == build_schema_regexp(
+        semver.SCHEMA, semver.SCHEMA_PARTS_PARSING
+    )
+    assert matcher.match("1.2.3") == {"major": "1", "minor": "2", "patch": "3"}
+    assert matcher.match("1.2") is None
+
+
+@pytest.mark.parametrize(
+    "schema, value, expected",
+    (
+        ("YY.MINOR.MICRO", "24.1.0", {"short_year": "24", "minor": "1"}),
+        ("YYYY.MM.DD", "2024.10.17", {"year": "2024", "month": "10"}),
+        ("YYYY.MM.DD", "24.10.17", None),
+    ),
+)
+def test_parse_version(schema, value, expected):
+    maybe_parsed = parse_version(schema, calver.SCHEMA_PARTS_PARSING, value)
+    if expected is None:
+        assert maybe_parsed is None
+    else:
+        assert maybe_parsed is not None
+        assert expected.items() <= maybe_parsed.items()
@@ -226,3 +226,15 @@ def test_pre_release_update_not_pre_release(
     current: PreRelease, update_config: UpdateConfig
 ):
     assert current.update(update_config) is None
+
+
+def test_pre_release_ordering():
+    pre_releases = [
+        PreRelease(pre_release_type=PreReleaseTypeEnum.alpha, number=0),
+        PreRelease(pre_release_type=PreReleaseTypeEnum.alpha, number=10),
+        PreRelease(pre_release_type=PreReleaseTypeEnum.beta, number=1),
+        PreRelease(pre_release_type=PreReleaseTypeEnum.rc, number=0),
+    ]
+    assert sorted(pre_releases, reverse=True) == pre_releases[::-1]
+    with pytest.raises(TypeError):
+        assert PreRelease() < "a0"
@@ -78,3 +78,14 @@ def test_semver_update(
     semver: SemVer, update_config: UpdateConfig, expected: SemVer
 ):
     assert semver.update(update_config) == expected
+
+
+def test_semver_ordering():
+    versions = [item for item, _ in VERSIONS]
+    assert sorted(versions, reverse=True) == versions[::-1]
+    assert SemVer(major=1, minor=0, patch=0) <= SemVer(
+        major=1, minor=0, patch=0
+    )
+    assert SemVer(major=1, minor=0, patch=0) != "1.0.0"
+    with pytest.raises(TypeError):
+        assert SemVer(major=1, minor=0, patch=0) < "1.0.0"
@@ -1,4 +1,5 @@
 import dataclasses
+import datetime
 import json
 from pathlib import Path
 
@@ -8,13 +9,17 @@ import tomli_w
 from badabump.configs import ProjectConfig, UpdateConfig
 from badabump.datetimes import utcnow_naive
 from badabump.enums import ProjectTypeEnum, VersionTypeEnum
+from badabump.versions import calver, semver
 from badabump.versions.calver import CalVer, SHORT_YEAR_START
-from badabump.versions.exceptions import VersionParseError
+from badabump.versions.exceptions import VersionError, VersionParseError
 from badabump.versions.pre_release import PreRelease, PreReleaseTypeEnum
 from badabump.versions.semver import SemVer
 from badabump.versions.version import (
     find_project_version,
+    get_version_parser,
     guess_version_from_tag,
+    parse_tags,
+    simulate_updates,
     Version,
 )
 
@@ -109,11 +114,110 @@ def test_guess_version_from_tag_invalid_value(invalid_value, tag_format):
         guess_version_from_tag(invalid_value, tag_format=tag_format)
 
 
+def test_get_version_parser():
+    calver_parts = dict(calver.SCHEMA_PARTS_PARSING)
+    semver_parts = dict(semver.SCHEMA_PARTS_PARSING)
+
+    parser = get_version_parser(
+        VersionTypeEnum.calver, "YY.MINOR.MICRO", ProjectTypeEnum.python
+    )
+    assert parser is get_version_parser(
+        VersionTypeEnum.calver, "YY.MINOR.MICRO", ProjectTypeEnum.python
+    )
+    assert parser.parse("24.1.0") == (
+        CalVer(year=2024, minor=1, micro=0, schema="YY.MINOR.MICRO"),
+        None,
+    )
+    assert parser.parse("24.1.0rc1") == (
+        CalVer(year=2024, minor=1, micro=0, schema="YY.MINOR.MICRO"),
+        PreRelease(pre_release_type=PreReleaseTypeEnum.rc, number=1),
+    )
+
+    Version.parse("1.0.0b0", config=SEMVER_PROJECT_CONFIG)
+
+    # Schema parts are not mutated on parsing
+    assert calver.SCHEMA_PARTS_PARSING == calver_parts
+    assert semver.SCHEMA_PARTS_PARSING == semver_parts
+
+
+def test_parse_tags():
+    config = ProjectConfig(tag_format="release/{version}")
+    assert [
+        tag
+        for tag, _ in parse_tags(
+            (
+                "release/21.1.0",
+                "v22.1.0",
+                "release/20.2.0",
+                "release/21.1.0rc1",
+                "release/invalid",
+                "release/21.1.0c1",
+                "release/21.1.0b2",
+                "release/20.10.0",
+            ),
+            config,
+        )
+    ] == [
+        "release/20.2.0",
+        "release/20.10.0",
+        "release/21.1.0b2",
+        "release/21.1.0rc1",
+        "release/21.1.0",
+    ]
+
+
+def test_parse_tags_semver():
+    parsed = parse_tags(
+        ("v1.0.0-rc.0", "v1.0.0", "v1.0.0-beta.1", "v0.9.9"),
+        dataclasses.replace(
+            SEMVER_PROJECT_CONFIG, project_type=ProjectTypeEnum.javascript
+        ),
+    )
+    assert [tag for tag, _ in parsed] == [
+        "v0.9.9",
+        "v1.0.0-beta.1",
+        "v1.0.0-rc.0",
+        "v1.0.0",
+    ]
+    assert parsed[-1][1] == Version(version=SemVer(major=1, minor=0, patch=0))
+    assert max(version for _, version in parsed) == parsed[-1][1]
+
+
+def test_version_ordering_different_schemas():
+    first = Version(
+        version=SemVer(major=1, minor=0, patch=0),
+        pre_release=PreRelease(number=1),
+    )
+    second = Version(
+        version=SemVer(major=1, minor=0, patch=0, schema="v{}"),
+        pre_release=PreRelease(number=1),
+    )
+    assert first != second
+    assert (first < second) != (second < first)
+    assert (first > second) != (second > first)
+
+
+def test_version_ordering_not_implemented():
+    with pytest.raises(TypeError):
+        assert Version(version=SemVer(major=1, minor=0, patch=0)) < "1.0.0"
+
+
 def test_parse_version_parse_error():
     with pytest.raises(VersionParseError):
         Version.parse("invalid", config=SEMVER_PROJECT_CONFIG)
 
 
+@pytest.mark.parametrize(
+    "value, expected_exception",
+    (("1.0", VersionParseError), ("1.0rc1", VersionError)),
+)
+def test_parse_version_without_year(value, expected_exception):
+    with pytest.raises(expected_exception):
+        Version.parse(
+            value, config=ProjectConfig(version_schema="MINOR.MICRO")
+        )
+
+
 @pytest.mark.parametrize(
     "tag, config, expected",
     (
@@ -312,3 +416,56 @@ def test_version_update_semver(current, update_config, expected):
     current_version = Version.parse(current, config=SEMVER_PROJECT_CONFIG)
     next_version = current_version.update(update_config)
     assert next_version.format(config=SEMVER_PROJECT_CONFIG) == expected
+
+
+def test_guess_initial_version_now(tmp_path):
+    assert (
+        Version.guess_initial_version(
+            config=ProjectConfig(path=tmp_path, version_schema="YYYY.0M.0D"),
+            is_pre_release=False,
+            now=datetime.datetime(2024, 3, 1),
+        ).format(config=ProjectConfig())
+        == "2024.03.01"
+    )
+
+
+def test_simulate_updates():
+    config = ProjectConfig()
+    micro = UpdateConfig()
+    minor = UpdateConfig(is_minor_change=True, is_micro_change=False)
+    pre_release = UpdateConfig(is_pre_release=True)
+
+    versions = simulate_updates(
+        Version.parse("24.1.0", config=config),
+        (
+            (datetime.datetime(2024, 12, 1), micro),
+            (datetime.datetime(2024, 12, 2), minor),
+            (datetime.datetime(2025, 1, 1), pre_release),
+            (datetime.datetime(2025, 1, 2), pre_release),
+            (datetime.datetime(2025, 1, 3), micro),
+        ),
+    )
+    assert [item.format(config=config) for item in versions] == [
+        "24.1.1",
+        "24.2.0",
+        "25.1.0a0",
+        "25.1.0a1",
+        "25.1.0",
+    ]
+
+
+def test_simulate_updates_semver():
+    versions = simulate_updates(
+        Version.parse("1.0.0", config=SEMVER_PROJECT_CONFIG),
+        (
+            (
+                datetime.datetime(2024, 1, 1),
+                UpdateConfig(is_breaking_change=True, is_micro_change=False),
+            ),
+            (datetime.datetime(2025, 1, 1), UpdateConfig()),
+        ),
+    )
+    assert versions == (
+        Version(version=SemVer(major=2, minor=0, patch=0)),
+        Version(version=SemVer(major=2, minor=0, patch=1)),
+    )